@@ -1,16 +1,85 @@
 #!/usr/bin/env python3
 
+import functools
+import heapq
+import importlib.util
+import json
 import subprocess
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
 from .ffmpeg_utils import FFmpegUtils
 
-try:
-    import ffmpeg
-    FFMPEG_PYTHON_AVAILABLE = True
-except ImportError:
-    FFMPEG_PYTHON_AVAILABLE = False
+# Only check that ffmpeg-python is installed; the helpers that use it import it on first call
+FFMPEG_PYTHON_AVAILABLE = importlib.util.find_spec('ffmpeg') is not None
+
+_YTDLP_COMMON = ('--no-playlist', '--progress', '--no-warnings')
+_YTDLP_PLAYLIST_COMMON = ('--yes-playlist', '--progress', '--no-warnings')
+_YTDLP_AUDIO_OPTS = ('-x', '--audio-quality', '192K', '--ignore-errors', '--no-abort-on-error', '--prefer-ffmpeg')
+_YTDLP_BEST = ('-f', 'best')
+_OUTPUT_TEMPLATE = '%(title)s.%(ext)s'
+_PLAYLIST_OUTPUT_TEMPLATE = '%(playlist_index)s - %(title)s.%(ext)s'
+_VIDEO_INFO_KEYS = ('title', 'duration_string', 'uploader', 'view_count', 'extractor')
+
+_VALID_DOMAINS = frozenset({
+    'youtube.com', 'youtu.be', 'vimeo.com', 'dailymotion.com',
+    'twitch.tv', 'facebook.com', 'instagram.com', 'tiktok.com',
+    'twitter.com', 'x.com', 'reddit.com', 'soundcloud.com'
+})
+
+# Merge straight into MOV so a separate remux pass is only needed when no merge happened
+_YTDLP_MOV_MERGE_OPTS = ('--merge-output-format', 'mov', '--postprocessor-args', 'Merger+ffmpeg_o:-movflags +faststart')
+
+
+def _mov_merge_format(height_filter=''):
+    # The MOV muxer rejects VP9/AV1/Opus, so only H.264 + AAC pairs are merged; anything else falls
+    # back to a single pre-muxed file that the regular MOV conversion handles afterwards
+    return (f'bestvideo{height_filter}[vcodec^=avc1]+bestaudio[acodec^=mp4a]'
+            f'/best{height_filter}[ext=mp4]/best{height_filter}')
+
+_FFMPEG_QUIET = ('-y', '-hide_banner', '-loglevel', 'error')
+_MOV_COPY_ARGS = ('-c', 'copy', '-movflags', '+faststart', '-f', 'mov')
+_MOV_REENCODE_ARGS = (
+    '-c:v', 'libx264', '-preset', 'medium', '-crf', '23',
+    '-c:a', 'aac', '-movflags', '+faststart', '-f', 'mov'
+)
+
+@functools.lru_cache(maxsize=64)
+def _fetch_video_info_cached(yt_dlp_path, url):
+    # Failures raise, so only successful lookups end up in the cache
+    cmd = [yt_dlp_path, '--no-download', '--print-json', '--no-warnings', url]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    info = json.loads(result.stdout)
+    return {key: info[key] for key in _VIDEO_INFO_KEYS if key in info}
+
+@functools.lru_cache(maxsize=256)
+def _platform_from_url(url):
+    url_lower = url.lower()
+    if 'youtube.com' in url_lower or 'youtu.be' in url_lower:
+        return 'YouTube'
+    elif 'vimeo.com' in url_lower:
+        return 'Vimeo'
+    elif 'dailymotion.com' in url_lower:
+        return 'Dailymotion'
+    elif 'twitch.tv' in url_lower:
+        return 'Twitch'
+    elif 'facebook.com' in url_lower:
+        return 'Facebook'
+    elif 'instagram.com' in url_lower:
+        return 'Instagram'
+    elif 'tiktok.com' in url_lower:
+        return 'TikTok'
+    elif 'twitter.com' in url_lower or 'x.com' in url_lower:
+        return 'Twitter/X'
+    elif 'reddit.com' in url_lower:
+        return 'Reddit'
+    elif 'soundcloud.com' in url_lower:
+        return 'SoundCloud'
+    else:
+        return None
 
 class Downloader:
     def __init__(self, config):
@@ -110,15 +179,7 @@ class Downloader:
             print("Starting download...\n")
 
 
-            cmd = [
-                self.yt_dlp_path,
-                '--no-playlist',
-                '-f', 'best',
-                '-o', str(download_dir / '%(title)s.%(ext)s'),
-                '--progress',
-                '--no-warnings',
-                url
-            ]
+            cmd = [self.yt_dlp_path, *_YTDLP_COMMON, *_YTDLP_BEST, '-o', str(download_dir / _OUTPUT_TEMPLATE), url]
 
 
             cmd = self._add_ffmpeg_location_to_cmd(cmd)
@@ -210,13 +271,7 @@ class Downloader:
                 try:
 
                     temp_template = str(download_dir / 'temp_%(title)s.%(ext)s')
-                    cmd = [
-                        self.yt_dlp_path,
-                        '--no-playlist',
-                        '-o', temp_template,
-                        '--progress',
-                        '--no-warnings',
-                    ]
+                    cmd = [self.yt_dlp_path, *_YTDLP_COMMON, '-o', temp_template]
 
                     if strategy:
                         cmd.extend(['-f', strategy])
@@ -308,7 +363,8 @@ class Downloader:
     def _ffmpeg_downscale_video(self, input_path, output_path, target_height):
         try:
 
-            return self.ffmpeg.downscale_video(input_path, output_path, target_height)
+            # The temp download is deleted afterwards, so an undownscaled copy may share its inode
+            return self.ffmpeg.downscale_video(input_path, output_path, target_height, allow_link=True)
         except Exception as e:
             print(f"[ERROR] FFmpeg downscaling failed: {e}")
             return False
@@ -321,16 +377,7 @@ class Downloader:
             temp_path = download_dir / f"{temp_filename}.%(ext)s"
 
             format_opts = self._build_format_string("best", include_audio, output_format)
-            cmd = [
-                self.yt_dlp_path,
-                '--no-playlist',
-                '-o', str(temp_path),
-                '--progress',
-                '--no-warnings',
-            ]
-            if format_opts:
-                cmd.extend(format_opts)
-            cmd.append(url)
+            cmd = [self.yt_dlp_path, *_YTDLP_COMMON, '-o', str(temp_path), *format_opts, url]
             result = subprocess.run(cmd, cwd=str(download_dir), capture_output=False, text=True)
             if result.returncode == 0:
 
@@ -408,17 +455,9 @@ class Downloader:
         try:
 
             cmd = [
-                self.yt_dlp_path,
-                '--no-playlist',
-                '-x',
+                self.yt_dlp_path, *_YTDLP_COMMON, *_YTDLP_AUDIO_OPTS,
                 '--audio-format', audio_format,
-                '--audio-quality', '192K',
-                '-o', str(download_dir / '%(title)s.%(ext)s'),
-                '--progress',
-                '--no-warnings',
-                '--ignore-errors',
-                '--no-abort-on-error',
-                '--prefer-ffmpeg',
+                '-o', str(download_dir / _OUTPUT_TEMPLATE),
                 url
             ]
 
@@ -457,15 +496,7 @@ class Downloader:
         try:
             print("[INFO] Downloading video first...")
 
-            cmd = [
-                self.yt_dlp_path,
-                '--no-playlist',
-                '-f', 'best',
-                '-o', str(download_dir / '%(title)s.%(ext)s'),
-                '--progress',
-                '--no-warnings',
-                url
-            ]
+            cmd = [self.yt_dlp_path, *_YTDLP_COMMON, *_YTDLP_BEST, '-o', str(download_dir / _OUTPUT_TEMPLATE), url]
 
             cmd = self._add_ffmpeg_location_to_cmd(cmd)
             result = subprocess.run(
@@ -593,36 +624,6 @@ class Downloader:
             print(f"[ERROR] {target_format.upper()} conversion failed: {e}")
             return False
 
-    def _convert_to_mov(self, download_dir):
-        return self._convert_to_format(download_dir, 'mov')
-        try:
-
-            mp4_files = list(download_dir.glob("*.mp4"))
-            if not mp4_files:
-                print("[WARNING] No MP4 file found for MOV conversion")
-                return False
-
-            latest_mp4 = max(mp4_files, key=lambda x: x.stat().st_mtime)
-            mov_path = latest_mp4.with_suffix('.mov')
-            print(f"Converting {latest_mp4.name} to MOV format...")
-
-            if self.ffmpeg.is_available():
-                success = self._ffmpeg_convert_to_mov(str(latest_mp4), str(mov_path))
-                if success:
-
-                    latest_mp4.unlink()
-                    print(f"[SUCCESS] Converted to {mov_path.name}")
-                    return True
-                else:
-                    print("[ERROR] FFmpeg conversion to MOV failed")
-                    return False
-            else:
-                print("[ERROR] FFmpeg not available for MOV conversion")
-                return False
-        except Exception as e:
-            print(f"[ERROR] MOV conversion failed: {e}")
-            return False
-
     def _remove_audio_from_downloaded_files(self, download_dir):
         if not self.ffmpeg.is_available():
             print("[WARNING] FFmpeg not available. Cannot remove audio from video.")
@@ -902,78 +903,31 @@ class Downloader:
             return input_path
 
     def _ffmpeg_convert_to_mov(self, input_path, output_path):
+        # Write to a temp file and rename on success so a failed run never leaves a partial .mov
+        tmp_path = f"{output_path}.tmp"
         try:
-            if FFMPEG_PYTHON_AVAILABLE:
-
-                try:
-
-
-                    stream = ffmpeg.input(input_path)
-                    stream = ffmpeg.output(
-                        stream, 
-                        output_path,
-                        vcodec='copy',
-                        acodec='copy',
-                        movflags='faststart'
-                    )
-                    ffmpeg.run(stream, overwrite_output=True, quiet=True)
-                    return True
-                except Exception as e:
-
-                    print("[INFO] Fast conversion not possible, re-encoding video for MOV compatibility...")
-
-                    try:
-                        stream = ffmpeg.input(input_path)
-                        stream = ffmpeg.output(
-                            stream, 
-                            output_path,
-                            vcodec='libx264',
-                            acodec='aac',
-                            crf=23,
-                            preset='medium',
-                            movflags='faststart'
-                        )
-                        ffmpeg.run(stream, overwrite_output=True, quiet=True)
-                        return True
-                    except Exception as e2:
-                        print(f"[ERROR] FFmpeg MOV conversion failed: {e2}")
-
-
             if not self.ffmpeg.is_available():
                 print("[ERROR] FFmpeg not available for MOV conversion")
                 return False
 
-            cmd = [
-                self.ffmpeg.ffmpeg_path,
-                '-i', input_path,
-                '-c:v', 'copy',
-                '-c:a', 'copy',
-                '-movflags', 'faststart',
-                '-y',
-                output_path
-            ]
+            cmd = [self.ffmpeg.ffmpeg_path, *_FFMPEG_QUIET, '-i', input_path, *_MOV_COPY_ARGS, tmp_path]
             result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                return True
-            else:
-
-                print("[INFO] Fast conversion failed, re-encoding for MOV compatibility...")
-                cmd = [
-                    self.ffmpeg.ffmpeg_path,
-                    '-i', input_path,
-                    '-c:v', 'libx264',
-                    '-c:a', 'aac',
-                    '-crf', '23',
-                    '-preset', 'medium',
-                    '-movflags', 'faststart',
-                    '-y',
-                    output_path
-                ]
+            if result.returncode != 0:
+                print("[INFO] Fast conversion not possible, re-encoding video for MOV compatibility...")
+                cmd = [self.ffmpeg.ffmpeg_path, *_FFMPEG_QUIET, '-i', input_path, *_MOV_REENCODE_ARGS, tmp_path]
                 result = subprocess.run(cmd, capture_output=True, text=True)
-                return result.returncode == 0
+                if result.returncode != 0:
+                    print(f"[ERROR] FFmpeg MOV conversion failed: {result.stderr.strip()}")
+                    return False
+
+            os.replace(tmp_path, output_path)
+            return True
         except Exception as e:
             print(f"[ERROR] MOV conversion failed: {e}")
             return False
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
     def _build_format_string(self, resolution, include_audio, output_format="mp4"):
 
@@ -992,30 +946,35 @@ class Downloader:
 
                 format_string = f'bestvideo[height<={height}]/best[height<={height}]/best'
 
-        cmd_opts = ['-f', format_string]
-
         self._desired_format = output_format.lower() if output_format else 'mp4'
 
 
         if output_format and output_format.lower() not in ['webm', 'mov']:
 
             if output_format.lower() in ['mp4', 'mkv']:
-                cmd_opts.extend(['--remux-video', output_format.lower()])
+                return ('-f', format_string, '--remux-video', output_format.lower())
             else:
 
-                cmd_opts.extend(['--recode-video', output_format.lower()])
-        return cmd_opts
+                return ('-f', format_string, '--recode-video', output_format.lower())
+        if output_format and output_format.lower() == 'mov':
+            if include_audio:
+                format_string = _mov_merge_format('' if resolution == "best" else f'[height<={resolution.replace("p", "")}]')
+            return ('-f', format_string, *_YTDLP_MOV_MERGE_OPTS)
+        return ('-f', format_string)
 
     def _show_download_info(self, download_dir):
         try:
-            files = list(download_dir.glob("*"))
+            with os.scandir(download_dir) as it:
+                files = [(entry.name, entry.path) for entry in it if entry.is_file(follow_symlinks=False)]
             if files:
-                recent_files = sorted(files, key=lambda x: x.stat().st_mtime, reverse=True)[:5]
+                # stat() releases the GIL, so a small pool overlaps round-trips on network mounts
+                with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                    stats = list(pool.map(os.stat, [path for _, path in files]))
+                recent_files = heapq.nlargest(5, zip(files, stats), key=lambda x: x[1].st_mtime)
                 print("Recent downloads:")
-                for file in recent_files:
-                    size = file.stat().st_size
-                    size_mb = size / (1024 * 1024)
-                    print(f"   • {file.name} ({size_mb:.1f} MB)")
+                for (name, _), st in recent_files:
+                    size_mb = st.st_size / 1048576.0
+                    print(f"   • {name} ({size_mb:.1f} MB)")
         except Exception:
             pass
 
@@ -1024,23 +983,8 @@ class Downloader:
 
             if not self._is_valid_url(url):
                 return {'error': 'invalid_url', 'message': 'Invalid video URL. Please check the URL and try again.'}
-            cmd = [
-                self.yt_dlp_path,
-                '--no-download',
-                '--print-json',
-                '--no-warnings',
-                url
-            ]
 
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-
-            import json
-            info = json.loads(result.stdout)
+            info = _fetch_video_info_cached(self.yt_dlp_path, url)
 
             platform = self._get_platform_from_url(url)
             if not platform:
@@ -1081,40 +1025,24 @@ class Downloader:
         if not url:
             return False
 
-        if not (url.startswith('http://') or url.startswith('https://') or url.startswith('www.')):
+        if url.startswith('www.'):
+            url = 'https://' + url
+        elif not (url.startswith('http://') or url.startswith('https://')):
             return False
 
-        valid_domains = [
-            'youtube.com', 'youtu.be', 'vimeo.com', 'dailymotion.com',
-            'twitch.tv', 'facebook.com', 'instagram.com', 'tiktok.com',
-            'twitter.com', 'x.com', 'reddit.com', 'soundcloud.com'
-        ]
-        return any(domain in url.lower() for domain in valid_domains)
+        try:
+            host = urlparse(url).hostname
+        except ValueError:
+            return False
+        if not host:
+            return False
+
+        # Match the registered domain or any subdomain of it, never a substring
+        parts = host.split('.')
+        return any('.'.join(parts[i:]) in _VALID_DOMAINS for i in range(len(parts) - 1))
 
     def _get_platform_from_url(self, url):
-        url_lower = url.lower()
-        if 'youtube.com' in url_lower or 'youtu.be' in url_lower:
-            return 'YouTube'
-        elif 'vimeo.com' in url_lower:
-            return 'Vimeo'
-        elif 'dailymotion.com' in url_lower:
-            return 'Dailymotion'
-        elif 'twitch.tv' in url_lower:
-            return 'Twitch'
-        elif 'facebook.com' in url_lower:
-            return 'Facebook'
-        elif 'instagram.com' in url_lower:
-            return 'Instagram'
-        elif 'tiktok.com' in url_lower:
-            return 'TikTok'
-        elif 'twitter.com' in url_lower or 'x.com' in url_lower:
-            return 'Twitter/X'
-        elif 'reddit.com' in url_lower:
-            return 'Reddit'
-        elif 'soundcloud.com' in url_lower:
-            return 'SoundCloud'
-        else:
-            return None
+        return _platform_from_url(url)
 
     def _format_platform_name(self, extractor):
         extractor_lower = extractor.lower()
@@ -1261,7 +1189,6 @@ class Downloader:
                 check=True
             )
 
-            import json
             lines = result.stdout.strip().split('\n')
             if not lines or not lines[0]:
                 return {'error': 'empty', 'message': 'No playlist information found.'}
@@ -1301,7 +1228,7 @@ class Downloader:
                 return False
             download_dir = self._create_download_dir()
 
-            playlist_dir = download_dir / "Playlists" / f"playlist_{int(__import__('time').time())}"
+            playlist_dir = download_dir / "Playlists" / f"playlist_{int(time.time())}"
             playlist_dir.mkdir(parents=True, exist_ok=True)
             if download_type == "audio":
                 return self._download_playlist_audio(url, playlist_dir)
@@ -1322,7 +1249,7 @@ class Downloader:
                 return False
             download_dir = self._create_download_dir()
 
-            playlist_dir = download_dir / "Playlists" / f"playlist_{int(__import__('time').time())}"
+            playlist_dir = download_dir / "Playlists" / f"playlist_{int(time.time())}"
             playlist_dir.mkdir(parents=True, exist_ok=True)
             if download_type == "video":
                 return self._download_playlist_video_with_options(url, playlist_dir, resolution, include_audio, output_format)
@@ -1342,15 +1269,7 @@ class Downloader:
             print("Starting playlist download...\n")
 
 
-            cmd = [
-                self.yt_dlp_path,
-                '--yes-playlist',
-                '-f', 'best',
-                '-o', str(playlist_dir / '%(playlist_index)s - %(title)s.%(ext)s'),
-                '--progress',
-                '--no-warnings',
-                url
-            ]
+            cmd = [self.yt_dlp_path, *_YTDLP_PLAYLIST_COMMON, *_YTDLP_BEST, '-o', str(playlist_dir / _PLAYLIST_OUTPUT_TEMPLATE), url]
 
 
             cmd = self._add_ffmpeg_location_to_cmd(cmd)
@@ -1408,14 +1327,10 @@ class Downloader:
                 else:
                     format_string = f'bestvideo[height<={height}]'
 
-            cmd = [
-                self.yt_dlp_path,
-                '--yes-playlist',
-                '-f', format_string,
-                '-o', str(playlist_dir / '%(playlist_index)s - %(title)s.%(ext)s'),
-                '--progress',
-                '--no-warnings',
-            ]
+            if output_format and output_format.lower() == 'mov' and include_audio:
+                format_string = _mov_merge_format('' if resolution == "best" else f'[height<={height}]')
+
+            cmd = [self.yt_dlp_path, *_YTDLP_PLAYLIST_COMMON, '-f', format_string, '-o', str(playlist_dir / _PLAYLIST_OUTPUT_TEMPLATE)]
 
 
             if output_format and output_format.lower() not in ['webm', 'mov']:
@@ -1423,6 +1338,8 @@ class Downloader:
                     cmd.extend(['--remux-video', output_format.lower()])
                 else:
                     cmd.extend(['--recode-video', output_format.lower()])
+            elif output_format and output_format.lower() == 'mov':
+                cmd.extend(_YTDLP_MOV_MERGE_OPTS)
 
             cmd.append(url)
 
@@ -1442,7 +1359,7 @@ class Downloader:
 
             if result.returncode == 0:
 
-                if output_format and output_format.lower() == 'mov':
+                if output_format and output_format.lower() == 'mov' and any(playlist_dir.glob("*.mp4")):
                     print("\nConverting videos to MOV format...")
                     self._convert_playlist_to_mov(playlist_dir)
                 print("\n[SUCCESS] Playlist video download completed successfully!")
@@ -1464,15 +1381,7 @@ class Downloader:
             print("Starting playlist audio download...\n")
 
 
-            cmd = [
-                self.yt_dlp_path,
-                '--yes-playlist',
-                '-f', 'best',
-                '-o', str(playlist_dir / '%(playlist_index)s - %(title)s.%(ext)s'),
-                '--progress',
-                '--no-warnings',
-                url
-            ]
+            cmd = [self.yt_dlp_path, *_YTDLP_PLAYLIST_COMMON, *_YTDLP_BEST, '-o', str(playlist_dir / _PLAYLIST_OUTPUT_TEMPLATE), url]
 
 
             cmd = self._add_ffmpeg_location_to_cmd(cmd)
@@ -1592,9 +1501,17 @@ class Downloader:
             print(f"[INFO] Saving to: {download_dir}")
             from .ui.progress import Spinner
             spinner = Spinner("Downloading thumbnail...")
-            spinner.start()
-            result = subprocess.run(cmd, capture_output=True, cwd=str(download_dir), errors='replace')
-            spinner.stop()
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                       cwd=str(download_dir), errors='replace')
+            # Animate from this wait loop instead of a spinner thread
+            while True:
+                try:
+                    stdout, stderr = process.communicate(timeout=0.1)
+                    break
+                except subprocess.TimeoutExpired:
+                    spinner.tick()
+            spinner.clear()
+            result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
             if result.returncode == 0:
 
                 thumbnail_files = []
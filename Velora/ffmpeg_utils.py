@@ -1,97 +1,214 @@
 #!/usr/bin/env python3
 
+import asyncio
+import bisect
+import functools
+import json
 import os
 import sys
 import subprocess
 import shutil
-import ffmpeg
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
 
-class FFmpegUtils:
-    def __init__(self):
-        self.ffmpeg_path = self._find_ffmpeg()
-        self.ffprobe_path = self._find_ffprobe()
-    
-    def _find_ffmpeg(self) -> str:
-        # First try using 'which' command to find ffmpeg
-        try:
-            result = subprocess.run(['which', 'ffmpeg'], 
-                                  capture_output=True, text=True, check=True)
-            ffmpeg_path = result.stdout.strip()
-            if ffmpeg_path and self._check_executable(ffmpeg_path):
-                return ffmpeg_path
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            pass
-        
-        # Fallback to common paths
-        common_paths = [
-            'ffmpeg',
-            '/usr/bin/ffmpeg',
-            '/usr/local/bin/ffmpeg',
-            'ffmpeg.exe'
-        ]
-        
-        for path in common_paths:
-            if self._check_executable(path):
-                return path
-        
-        try:
-            subprocess.run(['ffmpeg', '-version'], 
-                         capture_output=True, check=True)
-            return 'ffmpeg'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("[WARNING] FFmpeg not found. Some features may be limited.")
-            print("Install FFmpeg: https://ffmpeg.org/download.html")
-            return None
-    
-    def _find_ffprobe(self) -> str:
-        # First try using 'which' command to find ffprobe
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_FFMPEG_FLAGS = ('-hide_banner', '-nostats', '-loglevel', 'error', '-y')
+# Input options for jobs that only touch a few packets; skips ffmpeg's default 5s stream analysis.
+# Not used for encodes, where a short analysis window can hurt output quality.
+_FAST_PROBE_ARGS = ('-probesize', '32768', '-analyzeduration', '0')
+
+# Only the fields get_video_info reads, so ffprobe's JSON stays small
+_PROBE_ENTRIES = ('format=format_name,duration,size,bit_rate'
+                  ':stream=codec_type,codec_name,width,height,r_frame_rate,bit_rate,sample_rate,channels')
+
+# Probe results keyed by (realpath, mtime_ns, size); a changed file gets a new key
+_PROBE_CACHE_SIZE = 256
+_probe_cache: 'OrderedDict[Tuple[str, int, int], Dict[str, Any]]' = OrderedDict()
+_probe_cache_lock = threading.Lock()
+
+# Overlay (x, y) expressions for add_watermark
+_WATERMARK_POSITIONS = {
+    'top-left': ('10', '10'),
+    'top-right': ('W-w-10', '10'),
+    'bottom-left': ('10', 'H-h-10'),
+    'bottom-right': ('W-w-10', 'H-h-10'),
+    'center': ('(W-w)/2', '(H-h)/2')
+}
+
+# Encoders tried, in order, when a caller asks for a codec generically
+_GENERIC_CODECS = {
+    'h264': ('h264_videotoolbox', 'h264_nvenc', 'h264_qsv', 'libx264'),
+    'hevc': ('hevc_videotoolbox', 'hevc_nvenc', 'hevc_qsv', 'libx265'),
+}
+
+# ffprobe codec names for encoders whose name doesn't start with the codec
+_ENCODER_CODEC_NAMES = {
+    'libx264': 'h264',
+    'libx265': 'hevc',
+    'libvpx': 'vp8',
+    'libvpx-vp9': 'vp9',
+    'libaom-av1': 'av1',
+    'libsvtav1': 'av1',
+    'libfdk_aac': 'aac',
+    'libmp3lame': 'mp3',
+    'libvorbis': 'vorbis',
+    'libopus': 'opus',
+}
+
+def _codec_name(encoder: str) -> str:
+    # h264_nvenc -> h264, hevc_qsv -> hevc
+    return _ENCODER_CODEC_NAMES.get(encoder, encoder.split('_')[0])
+
+def _parse_frame_rate(rate: str) -> float:
+    # ffprobe reports rates as "num/den" (e.g. "30000/1001"), sometimes "0/0"
+    num, _, den = rate.partition('/')
+    try:
+        return int(num) / int(den) if den else float(num)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+def _check_executable(path: str) -> bool:
+    try:
+        subprocess.run([path, '-version'],
+                     capture_output=True, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+
+def _locate_executable(name: str, common_paths: List[str]) -> Optional[str]:
+    # shutil.which is a stat/access check per candidate; only a file that
+    # exists and is executable gets the (much slower) -version run
+    for candidate in (name, *common_paths):
+        path = shutil.which(candidate)
+        if path and _check_executable(path):
+            return path
+    return None
+
+@functools.lru_cache(maxsize=1)
+def _find_ffmpeg() -> Optional[str]:
+    ffmpeg_path = _locate_executable('ffmpeg', ['/usr/bin/ffmpeg', '/usr/local/bin/ffmpeg', 'ffmpeg.exe'])
+    if ffmpeg_path is None:
+        print("[WARNING] FFmpeg not found. Some features may be limited.")
+        print("Install FFmpeg: https://ffmpeg.org/download.html")
+    return ffmpeg_path
+
+@functools.lru_cache(maxsize=1)
+def _find_ffprobe() -> Optional[str]:
+    return _locate_executable('ffprobe', ['/usr/bin/ffprobe', '/usr/local/bin/ffprobe', 'ffprobe.exe'])
+
+@functools.lru_cache(maxsize=4)
+def _available_encoders(ffmpeg_path: str) -> frozenset:
+    try:
+        result = subprocess.run([ffmpeg_path, '-hide_banner', '-encoders'],
+                              capture_output=True, text=True, check=True)
+    except (subprocess.CalledProcessError, OSError):
+        return frozenset()
+    # Encoder rows look like " V....D libx264    libx264 H.264 / AVC ..."
+    return frozenset(parts[1] for parts in map(str.split, result.stdout.splitlines())
+                     if len(parts) >= 2 and len(parts[0]) == 6)
+
+def _options_args(options: Dict[str, Any]) -> List[str]:
+    # {'vcodec': 'libx264', 'crf': 23} -> ['-c:v', 'libx264', '-crf', '23']
+    args = []
+    for key, value in options.items():
+        args.extend(('-c:v' if key == 'vcodec' else f'-{key}', str(value)))
+    return args
+
+@functools.lru_cache(maxsize=16)
+def _encoder_works(ffmpeg_path: str, encoder: str, encoder_args: Tuple[str, ...] = ()) -> bool:
+    # Hardware encoders can be compiled in without a usable device, so encode one test frame.
+    # encoder_args are the job's own vendor flags, which some devices and driver versions reject.
+    if encoder not in _available_encoders(ffmpeg_path):
+        return False
+    try:
+        subprocess.run([ffmpeg_path, *_FFMPEG_FLAGS, '-f', 'lavfi', '-i', 'nullsrc=s=256x256:d=0.1',
+                        '-frames:v', '1', '-c:v', encoder, *encoder_args, '-f', 'null', '-'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True, timeout=15)
+        return True
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        return False
+
+def _link_or_copy(src: str, dst: str, allow_link: bool = False) -> None:
+    # copyfile uses copy_file_range/sendfile where available. A hardlink shares the inode, so an
+    # in-place rewrite of dst would also change src; only callers that discard src opt in to it.
+    dst_dir = os.path.dirname(os.path.abspath(dst))
+    if allow_link and os.stat(src).st_dev == os.stat(dst_dir).st_dev and not os.path.exists(dst):
         try:
-            result = subprocess.run(['which', 'ffprobe'], 
-                                  capture_output=True, text=True, check=True)
-            ffprobe_path = result.stdout.strip()
-            if ffprobe_path and self._check_executable(ffprobe_path):
-                return ffprobe_path
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            os.link(src, dst)
+            return
+        except OSError:
             pass
-            
-        # Fallback to common paths
-        common_paths = [
-            'ffprobe',
-            '/usr/bin/ffprobe', 
-            '/usr/local/bin/ffprobe',
-            'ffprobe.exe'
-        ]
-        
-        for path in common_paths:
-            if self._check_executable(path):
-                return path
-        
-        try:
-            subprocess.run(['ffprobe', '-version'],
-                         capture_output=True, check=True)
-            return 'ffprobe'
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return None
-    
-    def _check_executable(self, path: str) -> bool:
-        try:
-            subprocess.run([path, '-version'],
-                         capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+    shutil.copyfile(src, dst)
+
+
+class FFmpegUtils:
+    def __init__(self, threads: Optional[int] = None):
+        self.ffmpeg_path = _find_ffmpeg()
+        self.ffprobe_path = _find_ffprobe()
+        # Encoder thread cap; None lets ffmpeg use every core
+        self.threads = threads
     
     def is_available(self) -> bool:
         return self.ffmpeg_path is not None
     
     def get_video_info(self, file_path: str) -> Dict[str, Any]:
+        try:
+            st = os.stat(file_path)
+            key = (os.path.realpath(file_path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        
+        if key is not None:
+            with _probe_cache_lock:
+                cached = _probe_cache.get(key)
+                if cached is not None:
+                    _probe_cache.move_to_end(key)
+                    return dict(cached)
+        
+        info = self._probe(file_path)
+        # Failed probes come back empty and are not cached
+        if info and key is not None:
+            with _probe_cache_lock:
+                _probe_cache[key] = dict(info)
+                _probe_cache.move_to_end(key)
+                if len(_probe_cache) > _PROBE_CACHE_SIZE:
+                    _probe_cache.popitem(last=False)
+        return info
+    
+    def _probe(self, file_path: str) -> Dict[str, Any]:
+        if PYAV_AVAILABLE:
+            # In-process libavformat: no ffprobe fork/exec per file
+            try:
+                return self._probe_with_pyav(file_path)
+            except Exception:
+                pass
+        
         if not self.ffprobe_path:
             return {}
         
         try:
-            probe = ffmpeg.probe(file_path)
+            result = subprocess.run(
+                [self.ffprobe_path, '-v', 'error', '-probesize', '32768', '-analyzeduration', '1000000',
+                 '-show_entries', _PROBE_ENTRIES, '-of', 'json', file_path],
+                capture_output=True
+            )
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.decode('utf-8', 'replace').strip())
+            probe = _json_loads(result.stdout)
             video_stream = next((stream for stream in probe['streams'] 
                                if stream['codec_type'] == 'video'), None)
             audio_stream = next((stream for stream in probe['streams'] 
@@ -109,7 +226,7 @@ class FFmpegUtils:
                     'video_codec': video_stream['codec_name'],
                     'width': int(video_stream['width']),
                     'height': int(video_stream['height']),
-                    'fps': eval(video_stream['r_frame_rate']),
+                    'fps': _parse_frame_rate(video_stream['r_frame_rate']),
                     'video_bitrate': int(video_stream.get('bit_rate', 0))
                 })
             
@@ -127,21 +244,65 @@ class FFmpegUtils:
             print(f"[WARNING] Could not get video info: {e}")
             return {}
     
+    def _probe_with_pyav(self, file_path: str) -> Dict[str, Any]:
+        with av.open(file_path) as container:
+            video_stream = next((stream for stream in container.streams if stream.type == 'video'), None)
+            audio_stream = next((stream for stream in container.streams if stream.type == 'audio'), None)
+            
+            info = {
+                'format': container.format.name,
+                'duration': container.duration / av.time_base if container.duration else 0.0,
+                'size': os.path.getsize(file_path),
+                'bitrate': container.bit_rate or 0
+            }
+            
+            if video_stream:
+                info.update({
+                    'video_codec': video_stream.codec_context.name,
+                    'width': video_stream.codec_context.width,
+                    'height': video_stream.codec_context.height,
+                    'fps': float(video_stream.base_rate or video_stream.average_rate or 0),
+                    'video_bitrate': video_stream.bit_rate or 0
+                })
+            
+            if audio_stream:
+                info.update({
+                    'audio_codec': audio_stream.codec_context.name,
+                    'audio_bitrate': audio_stream.bit_rate or 0,
+                    'sample_rate': audio_stream.codec_context.sample_rate,
+                    'channels': audio_stream.codec_context.channels
+                })
+            
+            return info
+    
+    def get_video_info_batch(self, file_paths: List[str]) -> List[Dict[str, Any]]:
+        """Probe several files at once, overlapping ffprobe startup; results keep input order"""
+        if not file_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(4, len(file_paths))) as pool:
+            return list(pool.map(self.get_video_info, file_paths))
+    
     def convert_video(self, input_path: str, output_path: str, 
                      codec: str = 'libx264', 
                      quality: str = 'medium',
-                     audio_codec: str = 'aac') -> bool:
+                     audio_codec: str = 'aac',
+                     allow_copy: bool = False) -> bool:
         if not self.is_available():
             print("[ERROR] FFmpeg not available for conversion")
             return False
         
         try:
+            # ffmpeg-python is only needed by the graph-built operations, so it is imported on use
+            import ffmpeg
             stream = ffmpeg.input(input_path)
             
-            video_opts = self._get_video_encoding_options(codec, quality)
-            audio_opts = {'acodec': audio_codec}
-            
-            stream = ffmpeg.output(stream, output_path, **video_opts, **audio_opts)
+            # Stream copy ignores quality, so it is only used when the caller asks for it
+            if allow_copy and self._maybe_copy_args(input_path, codec, audio_codec):
+                stream = ffmpeg.output(stream, output_path, c='copy')
+            else:
+                video_opts = self._get_video_encoding_options(codec, quality)
+                audio_opts = {'acodec': audio_codec}
+                stream = ffmpeg.output(stream, output_path, **video_opts, **audio_opts)
             ffmpeg.run(stream, overwrite_output=True, quiet=True)
             
             print(f"[SUCCESS] Converted video to: {output_path}")
@@ -158,16 +319,7 @@ class FFmpegUtils:
             return False
         
         try:
-            stream = ffmpeg.input(input_path)
-            
-            audio_opts = {
-                'acodec': 'libmp3lame' if format == 'mp3' else 'libvorbis',
-                'audio_bitrate': quality,
-                'vn': None
-            }
-            
-            stream = ffmpeg.output(stream, output_path, **audio_opts)
-            ffmpeg.run(stream, overwrite_output=True, quiet=True)
+            self._run_ffmpeg(self._extract_audio_args(input_path, output_path, format, quality))
             
             print(f"[SUCCESS] Extracted audio to: {output_path}")
             return True
@@ -183,16 +335,7 @@ class FFmpegUtils:
             return False
         
         try:
-            stream = ffmpeg.input(input_path, ss=start_time)
-            
-            if duration:
-                stream = ffmpeg.output(stream, output_path, t=duration, c='copy')
-            elif end_time:
-                stream = ffmpeg.output(stream, output_path, to=end_time, c='copy')
-            else:
-                stream = ffmpeg.output(stream, output_path, c='copy')
-            
-            ffmpeg.run(stream, overwrite_output=True, quiet=True)
+            self._run_ffmpeg(self._trim_video_args(input_path, output_path, start_time, duration, end_time))
             
             print(f"[SUCCESS] Trimmed video to: {output_path}")
             return True
@@ -209,6 +352,7 @@ class FFmpegUtils:
             return False
         
         try:
+            import ffmpeg
             stream = ffmpeg.input(input_path)
             
             if maintain_aspect and height is None:
@@ -239,6 +383,7 @@ class FFmpegUtils:
             return False
         
         try:
+            import ffmpeg
             # Create input streams
             inputs = [ffmpeg.input(path) for path in video_paths]
             
@@ -261,24 +406,17 @@ class FFmpegUtils:
             return False
         
         try:
+            import ffmpeg
             main = ffmpeg.input(input_path)
             watermark = ffmpeg.input(watermark_path)
             
-            positions = {
-                'top-left': '10:10',
-                'top-right': 'W-w-10:10',
-                'bottom-left': '10:H-h-10',
-                'bottom-right': 'W-w-10:H-h-10',
-                'center': '(W-w)/2:(H-h)/2'
-            }
-            
-            pos = positions.get(position, positions['bottom-right'])
+            x, y = _WATERMARK_POSITIONS.get(position, _WATERMARK_POSITIONS['bottom-right'])
             
             # Apply watermark with opacity
             watermark = ffmpeg.filter(watermark, 'format', 'yuva420p')
             watermark = ffmpeg.filter(watermark, 'colorchannelmixer', aa=opacity)
             
-            stream = ffmpeg.overlay(main, watermark, x=pos.split(':')[0], y=pos.split(':')[1])
+            stream = ffmpeg.overlay(main, watermark, x=x, y=y)
             stream = ffmpeg.output(stream, output_path)
             ffmpeg.run(stream, overwrite_output=True, quiet=True)
             
@@ -289,9 +427,27 @@ class FFmpegUtils:
             print(f"[ERROR] Watermarking failed: {e}")
             return False
     
+    def _resolve_codec(self, codec: str, quality: str = 'medium') -> str:
+        candidates = _GENERIC_CODECS.get(codec)
+        if candidates is None:
+            return codec
+        if not self.ffmpeg_path:
+            return candidates[-1]
+        for encoder in candidates[:-1]:
+            encoder_args = tuple(_options_args(self._quality_options(encoder, quality)))
+            if _encoder_works(self.ffmpeg_path, encoder, encoder_args):
+                return encoder
+        return candidates[-1]
+    
     def _get_video_encoding_options(self, codec: str, quality: str) -> Dict[str, Any]:
+        codec = self._resolve_codec(codec, quality)
         options = {'vcodec': codec}
-        
+        if self.threads:
+            options['threads'] = self.threads
+        options.update(self._quality_options(codec, quality))
+        return options
+    
+    def _quality_options(self, codec: str, quality: str) -> Dict[str, Any]:
         if codec == 'libx264':
             quality_map = {
                 'low': {'crf': 28, 'preset': 'fast'},
@@ -306,11 +462,31 @@ class FFmpegUtils:
                 'high': {'crf': 23, 'preset': 'slow'},
                 'ultra': {'crf': 18, 'preset': 'veryslow'}
             }
+        elif codec.endswith('_nvenc'):
+            quality_map = {
+                'low': {'preset': 'p4', 'rc': 'vbr', 'cq': 28, 'b:v': 0},
+                'medium': {'preset': 'p4', 'rc': 'vbr', 'cq': 23, 'b:v': 0},
+                'high': {'preset': 'p6', 'rc': 'vbr', 'cq': 19, 'b:v': 0},
+                'ultra': {'preset': 'p7', 'rc': 'vbr', 'cq': 16, 'b:v': 0}
+            }
+        elif codec.endswith('_qsv'):
+            quality_map = {
+                'low': {'global_quality': 28, 'preset': 'fast'},
+                'medium': {'global_quality': 23, 'preset': 'medium'},
+                'high': {'global_quality': 18, 'preset': 'slow'},
+                'ultra': {'global_quality': 15, 'preset': 'veryslow'}
+            }
+        elif codec.endswith('_videotoolbox'):
+            quality_map = {
+                'low': {'q:v': 45},
+                'medium': {'q:v': 60},
+                'high': {'q:v': 75},
+                'ultra': {'q:v': 85}
+            }
         else:
-            return options
+            return {}
         
-        options.update(quality_map.get(quality, quality_map['medium']))
-        return options
+        return quality_map.get(quality, quality_map['medium'])
     
     def create_gif(self, input_path: str, output_path: str,
                   start_time: str = '0', duration: str = '10',
@@ -320,11 +496,17 @@ class FFmpegUtils:
             return False
         
         try:
-            stream = ffmpeg.input(input_path, ss=start_time, t=duration)
-            stream = ffmpeg.filter(stream, 'fps', fps=fps, round='up')
-            stream = ffmpeg.filter(stream, 'scale', width, -1)
-            stream = ffmpeg.output(stream, output_path)
-            ffmpeg.run(stream, overwrite_output=True, quiet=True)
+            # Build one palette for the clip and reuse it, instead of quantizing every frame from scratch
+            filter_graph = (
+                f"fps={fps}:round=up,scale={width}:-1:flags=lanczos,split[s0][s1];"
+                "[s0]palettegen=max_colors=128[p];"
+                "[s1][p]paletteuse=dither=bayer:bayer_scale=3"
+            )
+            self._run_ffmpeg([
+                '-ss', str(start_time), '-t', str(duration), '-i', input_path,
+                '-filter_complex', filter_graph,
+                output_path
+            ])
             
             print(f"[SUCCESS] Created GIF: {output_path}")
             return True
@@ -340,9 +522,7 @@ class FFmpegUtils:
             return False
         
         try:
-            stream = ffmpeg.input(input_path, ss=time)
-            stream = ffmpeg.output(stream, output_path, vframes=1)
-            ffmpeg.run(stream, overwrite_output=True, quiet=True)
+            self._run_ffmpeg(self._thumbnail_args(input_path, output_path, time))
             
             print(f"[SUCCESS] Extracted thumbnail to: {output_path}")
             return True
@@ -351,7 +531,253 @@ class FFmpegUtils:
             print(f"[ERROR] Thumbnail extraction failed: {e}")
             return False
     
-    def downscale_video(self, input_path: str, output_path: str, target_height: int) -> bool:
+    def _convert_video_args(self, input_path: str, output_path: str,
+                            codec: str, quality: str, audio_codec: str,
+                            allow_copy: bool = False) -> List[str]:
+        codec_args = self._maybe_copy_args(input_path, codec, audio_codec) if allow_copy else None
+        if codec_args is None:
+            codec_args = [*self._encoding_args(codec, quality), '-c:a', audio_codec]
+        return ['-i', input_path, *codec_args, output_path]
+    
+    def _maybe_copy_args(self, input_path: str, target_vcodec: str, target_acodec: str) -> Optional[List[str]]:
+        """Return stream-copy args when the input already uses the target codecs, else None"""
+        info = self.get_video_info(input_path)
+        if not info or info.get('video_codec') != _codec_name(target_vcodec):
+            return None
+        if 'audio_codec' in info and info['audio_codec'] != _codec_name(target_acodec):
+            return None
+        return ['-c', 'copy']
+    
+    def _encoding_args(self, codec: str, quality: str) -> List[str]:
+        return _options_args(self._get_video_encoding_options(codec, quality))
+    
+    def _extract_audio_args(self, input_path: str, output_path: str,
+                            format: str, quality: str) -> List[str]:
+        acodec = 'libmp3lame' if format == 'mp3' else 'libvorbis'
+        return ['-i', input_path, '-vn', '-c:a', acodec, '-b:a', quality, output_path]
+    
+    def _trim_video_args(self, input_path: str, output_path: str,
+                         start_time: str, duration: str = None, end_time: str = None) -> List[str]:
+        # -ss goes before -i so ffmpeg seeks in the container instead of decoding up to start_time.
+        # With -c copy the cut snaps to the preceding keyframe; frame-exact cuts need a re-encode.
+        args = ['-ss', start_time]
+        if duration:
+            args.extend(('-t', duration))
+        elif end_time:
+            args.extend(('-to', end_time))
+        args.extend((*_FAST_PROBE_ARGS, '-i', input_path, '-c', 'copy', output_path))
+        return args
+    
+    def _thumbnail_args(self, input_path: str, output_path: str, time: str) -> List[str]:
+        # Input-side -ss: seek in the container, then decode forward to the exact frame
+        return ['-ss', time, *_FAST_PROBE_ARGS, '-i', input_path, '-frames:v', '1', output_path]
+    
+    def _run_ffmpeg(self, args: List[str]) -> None:
+        # ffmpeg writes nothing useful to stdout; stderr is only decoded on failure
+        result = subprocess.run([self.ffmpeg_path, *_FFMPEG_FLAGS, *args],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.decode('utf-8', 'replace').strip() or f"ffmpeg exited with code {result.returncode}")
+    
+    async def _run_ffmpeg_async(self, args: List[str]) -> None:
+        proc = await asyncio.create_subprocess_exec(
+            self.ffmpeg_path, *_FFMPEG_FLAGS, *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        # communicate() drains stderr while waiting, so a chatty ffmpeg can't block on a full pipe
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(stderr.decode('utf-8', 'replace').strip() or f"ffmpeg exited with code {proc.returncode}")
+    
+    async def convert_video_async(self, input_path: str, output_path: str,
+                                  codec: str = 'libx264',
+                                  quality: str = 'medium',
+                                  audio_codec: str = 'aac',
+                                  allow_copy: bool = False) -> bool:
+        if not self.is_available():
+            print("[ERROR] FFmpeg not available for conversion")
+            return False
+        
+        try:
+            # Encoder probing and ffprobe block, so the args are built off the event loop
+            args = await asyncio.to_thread(self._convert_video_args, input_path, output_path, codec, quality,
+                                           audio_codec, allow_copy)
+            await self._run_ffmpeg_async(args)
+            print(f"[SUCCESS] Converted video to: {output_path}")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Video conversion failed: {e}")
+            return False
+    
+    async def extract_audio_async(self, input_path: str, output_path: str,
+                                  format: str = 'mp3', quality: str = '192k') -> bool:
+        if not self.is_available():
+            print("[ERROR] FFmpeg not available for audio extraction")
+            return False
+        
+        try:
+            await self._run_ffmpeg_async(self._extract_audio_args(input_path, output_path, format, quality))
+            print(f"[SUCCESS] Extracted audio to: {output_path}")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Audio extraction failed: {e}")
+            return False
+    
+    async def trim_video_async(self, input_path: str, output_path: str,
+                               start_time: str, duration: str = None, end_time: str = None) -> bool:
+        if not self.is_available():
+            print("[ERROR] FFmpeg not available for trimming")
+            return False
+        
+        try:
+            await self._run_ffmpeg_async(self._trim_video_args(input_path, output_path, start_time, duration, end_time))
+            print(f"[SUCCESS] Trimmed video to: {output_path}")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Video trimming failed: {e}")
+            return False
+    
+    async def get_thumbnail_async(self, input_path: str, output_path: str,
+                                  time: str = '00:00:01') -> bool:
+        if not self.is_available():
+            print("[ERROR] FFmpeg not available for thumbnail extraction")
+            return False
+        
+        try:
+            await self._run_ffmpeg_async(self._thumbnail_args(input_path, output_path, time))
+            print(f"[SUCCESS] Extracted thumbnail to: {output_path}")
+            return True
+        except Exception as e:
+            print(f"[ERROR] Thumbnail extraction failed: {e}")
+            return False
+    
+    def convert_video_parallel(self, input_path: str, output_path: str,
+                               codec: str = 'libx264',
+                               quality: str = 'medium',
+                               audio_codec: str = 'aac',
+                               n_segments: Optional[int] = None) -> bool:
+        """Transcode keyframe-aligned segments concurrently, then join them without re-encoding"""
+        if not self.is_available():
+            print("[ERROR] FFmpeg not available for conversion")
+            return False
+        
+        if n_segments is None:
+            n_segments = max(1, (os.cpu_count() or 1) // 2)
+        
+        try:
+            info = self.get_video_info(input_path)
+            cuts = []
+            if n_segments > 1 and info.get('duration') and self.ffprobe_path:
+                cuts = self._segment_boundaries(self._keyframe_times(input_path), info['duration'], n_segments)
+            if len(cuts) < 2:
+                # Too short or too few keyframes to split; a single encode is just as fast
+                return self.convert_video(input_path, output_path, codec, quality, audio_codec)
+            
+            encoding_args = self._encoding_args(codec, quality)
+            if not self.threads:
+                encoding_args.extend(('-threads', str(max(1, (os.cpu_count() or 1) // len(cuts)))))
+            asyncio.run(self._convert_segments_async(input_path, output_path, cuts, encoding_args, audio_codec))
+            
+            print(f"[SUCCESS] Converted video to: {output_path}")
+            return True
+            
+        except Exception as e:
+            print(f"[ERROR] Parallel video conversion failed: {e}")
+            return False
+    
+    def transcode_multi(self, input_path: str, outputs: List[Dict[str, Any]]) -> bool:
+        """Decode once and encode several renditions, e.g. a 1080p/720p/480p ladder"""
+        # Each output: {'path': ..., 'height'?: int, 'codec'?: str, 'quality'?: str, 'audio_codec'?: str}
+        if not self.is_available():
+            print("[ERROR] FFmpeg not available for conversion")
+            return False
+        
+        if not outputs:
+            print("[ERROR] Need at least 1 output to transcode")
+            return False
+        
+        try:
+            # One split feeds every encoder, so the input is only decoded once
+            filters = [f"[0:v]split={len(outputs)}" + ''.join(f'[s{i}]' for i in range(len(outputs)))]
+            output_args = []
+            for i, output in enumerate(outputs):
+                height = output.get('height')
+                filters.append(f"[s{i}]scale=-2:{height}[v{i}]" if height else f"[s{i}]null[v{i}]")
+                output_args.extend((
+                    '-map', f'[v{i}]', '-map', '0:a?',
+                    *self._encoding_args(output.get('codec', 'libx264'), output.get('quality', 'medium')),
+                    '-c:a', output.get('audio_codec', 'aac'),
+                    output['path']
+                ))
+            self._run_ffmpeg(['-i', input_path, '-filter_complex', ';'.join(filters), *output_args])
+            
+            for output in outputs:
+                print(f"[SUCCESS] Converted video to: {output['path']}")
+            return True
+            
+        except Exception as e:
+            print(f"[ERROR] Multi-output transcoding failed: {e}")
+            return False
+    
+    def _keyframe_times(self, input_path: str) -> List[float]:
+        # Reading packet flags needs no decoding, so this is cheap even for long files
+        cmd = [self.ffprobe_path, '-v', 'error', '-select_streams', 'v:0',
+               '-show_entries', 'packet=pts_time,flags', '-of', 'csv=p=0', input_path]
+        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        times = []
+        for line in result.stdout.splitlines():
+            pts, _, flags = line.partition(',')
+            if flags.startswith('K') and pts not in ('', 'N/A'):
+                times.append(float(pts))
+        if not times:
+            return []
+        times.sort()
+        # -ss is relative to the start of the file, so drop any initial timestamp offset
+        offset = times[0]
+        return [t - offset for t in times]
+    
+    def _segment_boundaries(self, keyframes: List[float], duration: float, n_segments: int) -> List[float]:
+        cuts = [0.0]
+        for i in range(1, n_segments):
+            index = bisect.bisect_left(keyframes, duration * i / n_segments)
+            if index == len(keyframes):
+                break
+            if keyframes[index] > cuts[-1]:
+                cuts.append(keyframes[index])
+        return cuts
+    
+    async def _convert_segments_async(self, input_path: str, output_path: str, cuts: List[float],
+                                      encoding_args: List[str], audio_codec: str) -> None:
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+        with tempfile.TemporaryDirectory(dir=output_dir) as tmp_dir:
+            jobs = []
+            list_lines = []
+            for i, (start, end) in enumerate(zip(cuts, [*cuts[1:], None])):
+                segment_path = os.path.join(tmp_dir, f'segment_{i:03d}.ts')
+                args = ['-ss', f'{start:.6f}', '-i', input_path]
+                if end is not None:
+                    args.extend(('-t', f'{end - start:.6f}'))
+                # Audio is left out here: per-segment AAC priming would leave gaps and drift at every cut
+                args.extend((*encoding_args, '-an', '-f', 'mpegts', segment_path))
+                jobs.append(self._run_ffmpeg_async(args))
+                escaped_path = segment_path.replace("'", "'\\''")
+                list_lines.append(f"file '{escaped_path}'")
+            # Let every segment finish before reporting, so none is still writing when tmp_dir goes away
+            for result in await asyncio.gather(*jobs, return_exceptions=True):
+                if isinstance(result, Exception):
+                    raise result
+            
+            list_path = os.path.join(tmp_dir, 'segments.txt')
+            with open(list_path, 'w') as f:
+                f.write('\n'.join(list_lines) + '\n')
+            # Join the video segments and encode the audio once, straight from the source
+            await self._run_ffmpeg_async(['-f', 'concat', '-safe', '0', '-i', list_path, '-i', input_path,
+                                          '-map', '0:v', '-map', '1:a?', '-c:v', 'copy', '-c:a', audio_codec,
+                                          output_path])
+    
+    def downscale_video(self, input_path: str, output_path: str, target_height: int,
+                        codec: str = 'libx264', allow_link: bool = False) -> bool:
         """Downscale video to target height while maintaining aspect ratio"""
         if not self.is_available():
             print("[ERROR] FFmpeg not available for downscaling")
@@ -365,40 +791,62 @@ class FFmpegUtils:
                 if current_height <= target_height:
                     print(f"[INFO] Video is already {current_height}p, no downscaling needed")
                     # Just copy the file if it's already smaller/equal to target
-                    shutil.copy2(input_path, output_path)
+                    _link_or_copy(input_path, output_path, allow_link)
                     return True
             
             # Use subprocess method directly as it's more reliable
-            return self._downscale_with_subprocess(input_path, output_path, target_height)
+            return self._downscale_with_subprocess(input_path, output_path, target_height, codec)
             
         except Exception as e:
             print(f"[ERROR] Video downscaling failed: {e}")
             return False
     
-    def _downscale_with_subprocess(self, input_path: str, output_path: str, target_height: int) -> bool:
+    def _downscale_with_subprocess(self, input_path: str, output_path: str, target_height: int,
+                                   codec: str = 'libx264') -> bool:
         """Fallback downscaling method using subprocess"""
         try:
-            cmd = [
-                self.ffmpeg_path,
+            # Put the moov atom up front for MP4 outputs; other containers keep their default muxer
+            mux_args = []
+            if Path(output_path).suffix.lower() in ('.mp4', '.m4v'):
+                mux_args = ['-movflags', '+faststart', '-f', 'mp4']
+            
+            self._run_ffmpeg([
                 '-i', input_path,
                 '-vf', f'scale=-2:{target_height}',  # -2 ensures width is even
-                '-c:v', 'libx264',
-                '-crf', '23',
-                '-preset', 'medium',
+                *self._encoding_args(codec, 'medium'),
                 '-c:a', 'copy',  # Copy audio without re-encoding
-                '-y',  # Overwrite output
+                *mux_args,
                 output_path
-            ]
+            ])
             
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"[SUCCESS] Downscaled video to: {output_path}")
-                return True
-            else:
-                print(f"[ERROR] FFmpeg subprocess failed: {result.stderr}")
-                return False
+            print(f"[SUCCESS] Downscaled video to: {output_path}")
+            return True
                 
         except Exception as e:
             print(f"[ERROR] Subprocess downscaling failed: {e}")
             return False
+
+class FFmpegJobPool:
+    """Run independent FFmpeg jobs concurrently with a bounded number of workers"""
+    def __init__(self, max_workers: Optional[int] = None):
+        cpu_count = os.cpu_count() or 1
+        if max_workers is None:
+            # A handful of processes saturates most machines; 4K encodes are memory hungry
+            max_workers = 2 if cpu_count <= 4 else min(cpu_count, 4)
+        self.max_workers = max_workers
+        # Split the cores between jobs so the pool as a whole uses roughly cpu_count threads
+        self.ffmpeg = FFmpegUtils(threads=max(1, cpu_count // max_workers))
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def submit(self, operation: str, *args, **kwargs) -> Future:
+        """Queue an FFmpegUtils operation by name, e.g. submit('convert_video', src, dst)"""
+        return self._executor.submit(getattr(self.ffmpeg, operation), *args, **kwargs)
+    
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+    
+    def __enter__(self) -> 'FFmpegJobPool':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.shutdown()
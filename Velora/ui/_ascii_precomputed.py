@@ -0,0 +1,5 @@
+# Generated by Velora/ui/ascii.py; do not edit by hand
+
+KEY = ('\n██╗   ██╗███████╗██╗      ██████╗ ██████╗  █████╗\n██║   ██║██╔════╝██║     ██╔═══██╗██╔══██╗██╔══██╗\n██║   ██║█████╗  ██║     ██║   ██║██████╔╝███████║\n╚██╗ ██╔╝██╔══╝  ██║     ██║   ██║██╔══██╗██╔══██║\n ╚████╔╝ ███████╗███████╗╚██████╔╝██║  ██║██║  ██║\n  ╚═══╝  ╚══════╝╚══════╝ ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝\n                                    Made by neoarz\n', (180, 0, 255), (0, 140, 255), 'neoarz', 'Made by ')
+
+ASCII = '\n\x1b[38;2;180;0;255m█\x1b[0m\x1b[38;2;175;3;255m█\x1b[0m\x1b[38;2;170;7;255m╗\x1b[0m   \x1b[38;2;165;11;255m█\x1b[0m\x1b[38;2;160;15;255m█\x1b[0m\x1b[38;2;155;19;255m╗\x1b[0m\x1b[38;2;150;23;255m█\x1b[0m\x1b[38;2;145;27;255m█\x1b[0m\x1b[38;2;140;31;255m█\x1b[0m\x1b[38;2;135;35;255m█\x1b[0m\x1b[38;2;130;38;255m█\x1b[0m\x1b[38;2;125;42;255m█\x1b[0m\x1b[38;2;120;46;255m█\x1b[0m\x1b[38;2;115;50;255m╗\x1b[0m\x1b[38;2;110;54;255m█\x1b[0m\x1b[38;2;105;58;255m█\x1b[0m\x1b[38;2;100;62;255m╗\x1b[0m      \x1b[38;2;95;66;255m█\x1b[0m\x1b[38;2;90;70;255m█\x1b[0m\x1b[38;2;85;73;255m█\x1b[0m\x1b[38;2;80;77;255m█\x1b[0m\x1b[38;2;75;81;255m█\x1b[0m\x1b[38;2;69;85;255m█\x1b[0m\x1b[38;2;65;89;255m╗\x1b[0m \x1b[38;2;60;93;255m█\x1b[0m\x1b[38;2;55;97;255m█\x1b[0m\x1b[38;2;50;101;255m█\x1b[0m\x1b[38;2;45;105;255m█\x1b[0m\x1b[38;2;40;108;255m█\x1b[0m\x1b[38;2;35;112;255m█\x1b[0m\x1b[38;2;30;116;255m╗\x1b[0m  \x1b[38;2;25;120;255m█\x1b[0m\x1b[38;2;20;124;255m█\x1b[0m\x1b[38;2;15;128;255m█\x1b[0m\x1b[38;2;10;132;255m█\x1b[0m\x1b[38;2;5;136;255m█\x1b[0m\x1b[38;2;0;140;255m╗\x1b[0m\n\x1b[38;2;180;0;255m█\x1b[0m\x1b[38;2;175;3;255m█\x1b[0m\x1b[38;2;171;6;255m║\x1b[0m   \x1b[38;2;166;10;255m█\x1b[0m\x1b[38;2;162;13;255m█\x1b[0m\x1b[38;2;158;17;255m║\x1b[0m\x1b[38;2;153;20;255m█\x1b[0m\x1b[38;2;149;23;255m█\x1b[0m\x1b[38;2;144;27;255m╔\x1b[0m\x1b[38;2;140;30;255m═\x1b[0m\x1b[38;2;136;34;255m═\x1b[0m\x1b[38;2;131;37;255m═\x1b[0m\x1b[38;2;127;40;255m═\x1b[0m\x1b[38;2;122;44;255m╝\x1b[0m\x1b[38;2;118;47;255m█\x1b[0m\x1b[38;2;114;51;255m█\x1b[0m\x1b[38;2;109;54;255m║\x1b[0m     \x1b[38;2;105;58;255m█\x1b[0m\x1b[38;2;100;61;255m█\x1b[0m\x1b[38;2;96;64;255m╔\x1b[0m\x1b[38;2;92;68;255m═\x1b[0m\x1b[38;2;87;71;255m═\x1b[0m\x1b[38;2;83;75;255m═\x1b[0m\x1b[38;2;79;78;255m█\x1b[0m\x1b[38;2;74;81;255m█\x1b[0m\x1b[38;2;70;85;255m╗\x1b[0m\x1b[38;2;65;88;255m█\x1b[0m\x1b[38;2;61;92;255m█\x1b[0m\x1b[38;2;57;95;255m╔\x1b[0m\x1b[38;2;52;99;255m═\x1b[0m\x1b[38;2;48;102;255m═\x1b[0m\x1b[38;2;43;105;255m█\x1b[0m\x1b[38;2;39;109;255m█\x1b[0m\x1b[38;2;35;112;255m╗\x1b[0m\x1b[38;2;30;116;255m█\x1b[0m\x1b[38;2;26;119;255m█\x1b[0m\x1b[38;2;21;122;255m╔\x1b[0m\x1b[38;2;17;126;255m═\x1b[0m\x1b[38;2;13;129;255m═\x1b[0m\x1b[38;2;8;133;255m█\x1b[0m\x1b[38;2;4;136;255m█\x1b[0m\x1b[38;2;0;140;255m╗\x1b[0m\n\x1b[38;2;180;0;255m█\x1b[0m\x1b[38;2;175;3;255m█\x1b[0m\x1b[38;2;170;7;255m║\x1b[0m   \x1b[38;2;165;11;255m█\x1b[0m\x1b[38;2;160;15;255m█\x1b[0m\x1b[38;2;155;19;255m║\x1b[0m\x1b[38;2;150;23;255m█\x1b[0m\x1b[38;2;145;27;255m█\x1b[0m\x1b[38;2;140;31;255m█\x1b[0m\x1b[38;2;135;35;255m█\x1b[0m\x1b[38;2;130;38;255m█\x1b[0m\x1b[38;2;125;42;255m╗\x1b[0m  \x1b[38;2;120;46;255m█\x1b[0m\x1b[38;2;115;50;255m█\x1b[0m\x1b[38;2;110;54;255m║\x1b[0m     \x1b[38;2;105;58;255m█\x1b[0m\x1b[38;2;100;62;255m█\x1b[0m\x1b[38;2;95;66;255m║\x1b[0m   \x1b[38;2;90;70;255m█\x1b[0m\x1b[38;2;85;73;255m█\x1b[0m\x1b[38;2;80;77;255m║\x1b[0m\x1b[38;2;75;81;255m█\x1b[0m\x1b[38;2;69;85;255m█\x1b[0m\x1b[38;2;65;89;255m█\x1b[0m\x1b[38;2;60;93;255m█\x1b[0m\x1b[38;2;55;97;255m█\x1b[0m\x1b[38;2;50;101;255m█\x1b[0m\x1b[38;2;45;105;255m╔\x1b[0m\x1b[38;2;40;108;255m╝\x1b[0m\x1b[38;2;35;112;255m█\x1b[0m\x1b[38;2;30;116;255m█\x1b[0m\x1b[38;2;25;120;255m█\x1b[0m\x1b[38;2;20;124;255m█\x1b[0m\x1b[38;2;15;128;255m█\x1b[0m\x1b[38;2;10;132;255m█\x1b[0m\x1b[38;2;5;136;255m█\x1b[0m\x1b[38;2;0;140;255m║\x1b[0m\n\x1b[38;2;180;0;255m╚\x1b[0m\x1b[38;2;175;3;255m█\x1b[0m\x1b[38;2;170;7;255m█\x1b[0m\x1b[38;2;165;11;255m╗\x1b[0m \x1b[38;2;161;14;255m█\x1b[0m\x1b[38;2;156;18;255m█\x1b[0m\x1b[38;2;151;22;255m╔\x1b[0m\x1b[38;2;146;25;255m╝\x1b[0m\x1b[38;2;142;29;255m█\x1b[0m\x1b[38;2;137;33;255m█\x1b[0m\x1b[38;2;132;36;255m╔\x1b[0m\x1b[38;2;127;40;255m═\x1b[0m\x1b[38;2;123;44;255m═\x1b[0m\x1b[38;2;118;47;255m╝\x1b[0m  \x1b[38;2;113;51;255m█\x1b[0m\x1b[38;2;108;55;255m█\x1b[0m\x1b[38;2;104;58;255m║\x1b[0m     \x1b[38;2;99;62;255m█\x1b[0m\x1b[38;2;94;66;255m█\x1b[0m\x1b[38;2;90;70;255m║\x1b[0m   \x1b[38;2;85;73;255m█\x1b[0m\x1b[38;2;80;77;255m█\x1b[0m\x1b[38;2;75;81;255m║\x1b[0m\x1b[38;2;71;84;255m█\x1b[0m\x1b[38;2;66;88;255m█\x1b[0m\x1b[38;2;61;92;255m╔\x1b[0m\x1b[38;2;56;95;255m═\x1b[0m\x1b[38;2;52;99;255m═\x1b[0m\x1b[38;2;47;103;255m█\x1b[0m\x1b[38;2;42;106;255m█\x1b[0m\x1b[38;2;37;110;255m╗\x1b[0m\x1b[38;2;33;114;255m█\x1b[0m\x1b[38;2;28;117;255m█\x1b[0m\x1b[38;2;23;121;255m╔\x1b[0m\x1b[38;2;18;125;255m═\x1b[0m\x1b[38;2;14;128;255m═\x1b[0m\x1b[38;2;9;132;255m█\x1b[0m\x1b[38;2;4;136;255m█\x1b[0m\x1b[38;2;0;140;255m║\x1b[0m\n \x1b[38;2;180;0;255m╚\x1b[0m\x1b[38;2;175;3;255m█\x1b[0m\x1b[38;2;171;6;255m█\x1b[0m\x1b[38;2;167;9;255m█\x1b[0m\x1b[38;2;163;13;255m█\x1b[0m\x1b[38;2;159;16;255m╔\x1b[0m\x1b[38;2;154;19;255m╝\x1b[0m \x1b[38;2;150;22;255m█\x1b[0m\x1b[38;2;146;26;255m█\x1b[0m\x1b[38;2;142;29;255m█\x1b[0m\x1b[38;2;138;32;255m█\x1b[0m\x1b[38;2;133;35;255m█\x1b[0m\x1b[38;2;129;39;255m█\x1b[0m\x1b[38;2;125;42;255m█\x1b[0m\x1b[38;2;121;45;255m╗\x1b[0m\x1b[38;2;117;48;255m█\x1b[0m\x1b[38;2;113;52;255m█\x1b[0m\x1b[38;2;108;55;255m█\x1b[0m\x1b[38;2;104;58;255m█\x1b[0m\x1b[38;2;100;61;255m█\x1b[0m\x1b[38;2;96;65;255m█\x1b[0m\x1b[38;2;92;68;255m█\x1b[0m\x1b[38;2;87;71;255m╗\x1b[0m\x1b[38;2;83;74;255m╚\x1b[0m\x1b[38;2;79;78;255m█\x1b[0m\x1b[38;2;75;81;255m█\x1b[0m\x1b[38;2;71;84;255m█\x1b[0m\x1b[38;2;66;87;255m█\x1b[0m\x1b[38;2;62;91;255m█\x1b[0m\x1b[38;2;58;94;255m█\x1b[0m\x1b[38;2;54;97;255m╔\x1b[0m\x1b[38;2;50;100;255m╝\x1b[0m\x1b[38;2;46;104;255m█\x1b[0m\x1b[38;2;41;107;255m█\x1b[0m\x1b[38;2;37;110;255m║\x1b[0m  \x1b[38;2;33;113;255m█\x1b[0m\x1b[38;2;29;117;255m█\x1b[0m\x1b[38;2;25;120;255m║\x1b[0m\x1b[38;2;20;123;255m█\x1b[0m\x1b[38;2;16;126;255m█\x1b[0m\x1b[38;2;12;130;255m║\x1b[0m  \x1b[38;2;8;133;255m█\x1b[0m\x1b[38;2;4;136;255m█\x1b[0m\x1b[38;2;0;140;255m║\x1b[0m\n  \x1b[38;2;180;0;255m╚\x1b[0m\x1b[38;2;175;3;255m═\x1b[0m\x1b[38;2;170;7;255m═\x1b[0m\x1b[38;2;166;10;255m═\x1b[0m\x1b[38;2;161;14;255m╝\x1b[0m  \x1b[38;2;156;17;255m╚\x1b[0m\x1b[38;2;152;21;255m═\x1b[0m\x1b[38;2;147;25;255m═\x1b[0m\x1b[38;2;143;28;255m═\x1b[0m\x1b[38;2;138;32;255m═\x1b[0m\x1b[38;2;133;35;255m═\x1b[0m\x1b[38;2;129;39;255m═\x1b[0m\x1b[38;2;124;43;255m╝\x1b[0m\x1b[38;2;120;46;255m╚\x1b[0m\x1b[38;2;115;50;255m═\x1b[0m\x1b[38;2;110;53;255m═\x1b[0m\x1b[38;2;106;57;255m═\x1b[0m\x1b[38;2;101;61;255m═\x1b[0m\x1b[38;2;96;64;255m═\x1b[0m\x1b[38;2;92;68;255m═\x1b[0m\x1b[38;2;87;71;255m╝\x1b[0m \x1b[38;2;83;75;255m╚\x1b[0m\x1b[38;2;78;78;255m═\x1b[0m\x1b[38;2;73;82;255m═\x1b[0m\x1b[38;2;69;86;255m═\x1b[0m\x1b[38;2;64;89;255m═\x1b[0m\x1b[38;2;60;93;255m═\x1b[0m\x1b[38;2;55;96;255m╝\x1b[0m \x1b[38;2;50;100;255m╚\x1b[0m\x1b[38;2;46;104;255m═\x1b[0m\x1b[38;2;41;107;255m╝\x1b[0m  \x1b[38;2;36;111;255m╚\x1b[0m\x1b[38;2;32;114;255m═\x1b[0m\x1b[38;2;27;118;255m╝\x1b[0m\x1b[38;2;23;122;255m╚\x1b[0m\x1b[38;2;18;125;255m═\x1b[0m\x1b[38;2;13;129;255m╝\x1b[0m  \x1b[38;2;9;132;255m╚\x1b[0m\x1b[38;2;4;136;255m═\x1b[0m\x1b[38;2;0;140;255m╝\x1b[0m\n                                    \x1b[38;2;255;255;255mMade by \x1b[0m\x1b[38;2;180;0;255mn\x1b[0m\x1b[38;2;144;28;255me\x1b[0m\x1b[38;2;108;56;255mo\x1b[0m\x1b[38;2;72;84;255ma\x1b[0m\x1b[38;2;36;112;255mr\x1b[0m\x1b[38;2;0;140;255mz\x1b[0m'
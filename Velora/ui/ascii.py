@@ -1,100 +1,89 @@
 #!/usr/bin/env python3
 
 import math
+import os
+
+_RESET = "\033[0m"
+
+# Membership in a small set is cheaper than a method call per character
+_WS = frozenset(" \t\n\r\v\f\xa0")
+
+# Foreground escape prefixes keyed by (r, g, b), shared across renders
+_ansi_cache = {}
+
+def _ansi_fg(rgb):
+    prefix = _ansi_cache.get(rgb)
+    if prefix is None:
+        r, g, b = rgb
+        prefix = _ansi_cache[rgb] = f"\033[38;2;{r};{g};{b}m"
+    return prefix
+
+def _rgb_interp(start, end, t):
+    return tuple(int(start[i] + (end[i] - start[i]) * t) for i in range(3))
+
+def _gradient_lut(start_color, end_color, n):
+    return [_ansi_fg(_rgb_interp(start_color, end_color, i / max(1, n - 1))) for i in range(n)]
+
+def _gradient_line(line, start_color, end_color):
+    # One scan finds the visible characters; they are then colored in place
+    parts = list(line)
+    visible = [i for i, char in enumerate(parts) if char not in _WS]
+    lut = _gradient_lut(start_color, end_color, len(visible))
+    for prefix, i in zip(lut, visible):
+        parts[i] = prefix + parts[i] + _RESET
+    return "".join(parts)
 
 def gradient_text(text, start_color, end_color):
-    def rgb_interp(start, end, t):
-        return tuple(int(start[i] + (end[i] - start[i]) * t) for i in range(3))
     lines = text.splitlines()
     gradient_lines = []
-    total_chars = sum(len(line) for line in lines if line.strip())
+    total_chars = sum(1 for line in lines for char in line if char not in _WS)
+    lut = _gradient_lut(start_color, end_color, total_chars)
     idx = 0
     for line in lines:
-        colored_line = ""
+        parts = []
         for char in line:
-            if char.strip():
-                t = idx / (total_chars - 1)
-                r, g, b = rgb_interp(start_color, end_color, t)
-                colored_line += f"\033[38;2;{r};{g};{b}m{char}\033[0m"
+            if char not in _WS:
+                parts.extend((lut[idx], char, _RESET))
                 idx += 1
             else:
-                colored_line += char
-        gradient_lines.append(colored_line)
+                parts.append(char)
+        gradient_lines.append("".join(parts))
     return "\n".join(gradient_lines)
 
 def gradient_text_selective(text, start_color, end_color, gradient_word, white_prefix=""):
-    def rgb_interp(start, end, t):
-        return tuple(int(start[i] + (end[i] - start[i]) * t) for i in range(3))
-    
     lines = text.splitlines()
     result_lines = []
     
     for line in lines:
-        if gradient_word in line and white_prefix in line:
-            prefix_start = line.find(white_prefix)
-            word_start = line.find(gradient_word)
+        prefix_start = line.find(white_prefix)
+        word_start = line.find(gradient_word) if prefix_start != -1 else -1
+        
+        if word_start != -1:
+            before_prefix = line[:prefix_start]
+            prefix_part = line[prefix_start:word_start]
+            word_part = gradient_word
+            after_word = line[word_start + len(gradient_word):]
             
-            if prefix_start != -1 and word_start != -1:
-                before_prefix = line[:prefix_start]
-                prefix_part = line[prefix_start:word_start]
-                word_part = gradient_word
-                after_word = line[word_start + len(gradient_word):]
-                
-                colored_before = ""
-                total_chars = sum(1 for char in before_prefix if char.strip())
-                idx = 0
-                for char in before_prefix:
-                    if char.strip():
-                        t = idx / max(1, total_chars - 1)
-                        r, g, b = rgb_interp(start_color, end_color, t)
-                        colored_before += f"\033[38;2;{r};{g};{b}m{char}\033[0m"
-                        idx += 1
-                    else:
-                        colored_before += char
-                
-                white_prefix_colored = f"\033[38;2;255;255;255m{prefix_part}\033[0m"
-                
-                colored_word = ""
-                word_chars = [char for char in word_part if char.strip()]
-                for i, char in enumerate(word_part):
-                    if char.strip():
-                        t = i / max(1, len(word_chars) - 1)
-                        r, g, b = rgb_interp(start_color, end_color, t)
-                        colored_word += f"\033[38;2;{r};{g};{b}m{char}\033[0m"
-                    else:
-                        colored_word += char
-                
-                result_lines.append(colored_before + white_prefix_colored + colored_word + after_word)
-            else:
-                colored_line = ""
-                total_chars = sum(1 for char in line if char.strip())
-                idx = 0
-                for char in line:
-                    if char.strip():
-                        t = idx / max(1, total_chars - 1)
-                        r, g, b = rgb_interp(start_color, end_color, t)
-                        colored_line += f"\033[38;2;{r};{g};{b}m{char}\033[0m"
-                        idx += 1
-                    else:
-                        colored_line += char
-                result_lines.append(colored_line)
-        else:
-            colored_line = ""
-            total_chars = sum(1 for char in line if char.strip())
-            idx = 0
-            for char in line:
-                if char.strip():
-                    t = idx / max(1, total_chars - 1)
-                    r, g, b = rgb_interp(start_color, end_color, t)
-                    colored_line += f"\033[38;2;{r};{g};{b}m{char}\033[0m"
-                    idx += 1
+            colored_before = _gradient_line(before_prefix, start_color, end_color)
+            
+            white_prefix_colored = f"{_ansi_fg((255, 255, 255))}{prefix_part}{_RESET}"
+            
+            parts = []
+            word_chars = [char for char in word_part if char not in _WS]
+            word_lut = [_ansi_fg(_rgb_interp(start_color, end_color, i / max(1, len(word_chars) - 1))) for i in range(len(word_part))]
+            for i, char in enumerate(word_part):
+                if char not in _WS:
+                    parts.extend((word_lut[i], char, _RESET))
                 else:
-                    colored_line += char
-            result_lines.append(colored_line)
+                    parts.append(char)
+            colored_word = "".join(parts)
+            
+            result_lines.append(colored_before + white_prefix_colored + colored_word + after_word)
+        else:
+            result_lines.append(_gradient_line(line, start_color, end_color))
     
     return "\n".join(result_lines)
 
-
 _ascii_art = """
 ██╗   ██╗███████╗██╗      ██████╗ ██████╗  █████╗
 ██║   ██║██╔════╝██║     ██╔═══██╗██╔══██╗██╔══██╗
@@ -113,6 +102,35 @@ See the full list of supported sites here: \033[34mhttps://github.com/yt-dlp/yt-
 _start_rgb = (180, 0, 255)
 _end_rgb = (0, 140, 255)  
 
-ascii = gradient_text_selective(_ascii_art, _start_rgb, _end_rgb, "neoarz", "Made by ")
+_gradient_word = "neoarz"
+_white_prefix = "Made by "
+
+_ascii_key = (_ascii_art, _start_rgb, _end_rgb, _gradient_word, _white_prefix)
+
+def _render_ascii():
+    return gradient_text_selective(_ascii_art, _start_rgb, _end_rgb, _gradient_word, _white_prefix)
+
+def _write_precomputed():
+    """Regenerate _ascii_precomputed.py; run `python -m Velora.ui.ascii` after editing the banner"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_ascii_precomputed.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Generated by Velora/ui/ascii.py; do not edit by hand\n\n")
+        f.write(f"KEY = {_ascii_key!r}\n\n")
+        f.write(f"ASCII = {_render_ascii()!r}\n")
+
+# The colored banner is a pure function of constants, so it ships prerendered
+try:
+    from ._ascii_precomputed import KEY as _precomputed_key, ASCII as _precomputed_ascii
+except ImportError:
+    _precomputed_key = _precomputed_ascii = None
+
+ascii = _precomputed_ascii if _precomputed_key == _ascii_key else _render_ascii()
+
+ascii_plain = _ascii_art
+
+# Pre-encoded for writers that bypass the text layer
+ASCII_BYTES = ascii.encode("utf-8")
+INFO_BYTES = INFO_MESSAGE.encode("utf-8")
 
-ascii_plain = _ascii_art
\ No newline at end of file
+if __name__ == "__main__":
+    _write_precomputed()
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
 import os
+import select
 import sys
 import tty
 import termios
+from contextlib import contextmanager
+
+from .ascii import ASCII_BYTES, INFO_BYTES
 
 try:
     from rich.console import Console
@@ -13,6 +17,21 @@ try:
 except Exception:
     RICH_AVAILABLE = False
 
+if RICH_AVAILABLE:
+    _SEL_PREFIX = Text("▶ ", style="bold cyan")
+    _UNSEL_PREFIX = Text("  ")
+
+_KEY_MAP = {
+    '\x1b[A': 'UP',
+    '\x1b[B': 'DOWN',
+    '\r': 'ENTER',
+    '\n': 'ENTER',
+    '\x03': 'INTERRUPT'
+}
+
+_YES = frozenset(('y', 'yes'))
+_NO = frozenset(('n', 'no'))
+
 
 class Menu:
     def __init__(self):
@@ -21,7 +40,12 @@ class Menu:
             self.console = Console()
 
     def clear_screen(self):
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Home + clear via ANSI instead of spawning a shell for `clear`
+        if os.name == 'posix':
+            sys.stdout.write("\033[H\033[2J")
+            sys.stdout.flush()
+        else:
+            os.system('cls')
 
     def print_header(self, title):
         print("=" * self.width)
@@ -50,22 +74,35 @@ class Menu:
     def print_warning(self, text):
         print(f"[WARNING] {text}")
 
+    def _prompt_line(self, prompt_str):
+        sys.stdout.write(prompt_str)
+        sys.stdout.flush()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
+
     def get_choice(self, prompt, min_val, max_val):
+        prompt_str = f"\n{prompt} ({min_val}-{max_val}): "
         while True:
-            try:
-                choice = int(input(f"\n{prompt} ({min_val}-{max_val}): "))
-                if min_val <= choice <= max_val:
-                    return choice
-                print(f"Please enter a number between {min_val} and {max_val}.")
-            except ValueError:
+            response = self._prompt_line(prompt_str)
+            # Check digits up front rather than paying for a ValueError on every typo
+            digits = response[1:] if response.startswith('-') else response
+            if not digits.isdecimal():
                 print("Please enter a valid number.")
+                continue
+            choice = int(response)
+            if min_val <= choice <= max_val:
+                return choice
+            print(f"Please enter a number between {min_val} and {max_val}.")
 
     def confirm_action(self, message):
+        prompt_str = f"\n{message} (y/n): "
         while True:
-            response = input(f"\n{message} (y/n): ").lower().strip()
-            if response in ['y', 'yes']:
+            response = self._prompt_line(prompt_str).lower()
+            if response in _YES:
                 return True
-            elif response in ['n', 'no']:
+            elif response in _NO:
                 return False
             print("Please enter 'y' or 'n'")
 
@@ -73,81 +110,115 @@ class Menu:
         for _ in range(num_lines):
             print("\033[F\033[K", end="")
 
-    def get_key(self):
+    @contextmanager
+    def _raw_mode(self):
+        # Looked up here rather than in __init__ so building a Menu works without a real stdin
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1)
-            if ch == '\x1b':
-                ch += sys.stdin.read(2)
-            return ch
+            tty.setraw(fd)
+            # Keep output processing on so frames drawn while raw still map \n to \r\n
+            mode = termios.tcgetattr(fd)
+            mode[1] |= termios.OPOST
+            termios.tcsetattr(fd, termios.TCSANOW, mode)
+            yield fd
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
+    def _read_key_raw(self, fd):
+        key = os.read(fd, 1)
+        # Arrow keys arrive as ESC [ X; a bare ESC has nothing queued behind it.
+        # Slow ptys and ssh can split the sequence, so keep reading until it is whole or input stops.
+        if key == b'\x1b':
+            while len(key) < 3 and select.select([fd], [], [], 0.05)[0]:
+                key += os.read(fd, 3 - len(key))
+        return key.decode('utf-8', 'replace')
+
+    def get_key(self):
+        with self._raw_mode() as fd:
+            return self._read_key_raw(fd)
+
+    def _option_line(self, option, is_selected):
+        if RICH_AVAILABLE:
+            if is_selected:
+                t = _SEL_PREFIX.copy()
+                t.append(option, style="bold underline bright_cyan")
+            else:
+                t = _UNSEL_PREFIX.copy()
+                t.append(option, style="white")
+            with self.console.capture() as capture:
+                self.console.print(t)
+            return capture.get()
+        return f"▶ {option}\n" if is_selected else f"  {option}\n"
+
     def interactive_menu(self, options, title="Select an option", show_ascii=False, clear_screen=True, show_instructions=True):
         selected = 0
+        last_selected = None
         max_index = len(options) - 1
-        prev_printed_lines = 0
+        # Lines printed below the options block: the blank line plus the instructions
+        trailing_lines = 1 + (1 if show_instructions else 0)
+        # Render both states of every option once per menu, not once per keypress
+        option_lines = [(self._option_line(option, False), self._option_line(option, True)) for option in options]
         print("\033[?25l", end="")
         sys.stdout.flush()
         try:
-            while True:
-                if clear_screen:
-                    self.clear_screen()
-                    prev_printed_lines = 0
-                else:
-                    if prev_printed_lines:
-                        self.clear_last_lines(prev_printed_lines)
-
-                if show_ascii:
-                    from .ascii import ascii, INFO_MESSAGE
-                    print(ascii)
-                    print(INFO_MESSAGE)
-
-                if RICH_AVAILABLE:
-                    if not show_ascii:
-                        self.console.print(Text(title, style="bold white"))
-
-                    for i, option in enumerate(options):
-                        if i == selected:
-                            t = Text("▶ ", style="bold cyan")
-                            t.append(option, style="bold underline bright_cyan")
-                            self.console.print(t)
+            with self._raw_mode() as fd:
+                while True:
+                    # Build the whole frame and emit it with a single write
+                    frame = []
+                    banner = None
+                    if last_selected is None:
+                        clear = "\033[H\033[2J" if clear_screen else ""
+                        if show_ascii:
+                            # The banner is already encoded, so it goes out as bytes ahead of the menu text
+                            banner = b"".join((clear.encode(), ASCII_BYTES, b"\n", INFO_BYTES, b"\n"))
                         else:
-                            t = Text("  ")
-                            t.append(option, style="white")
-                            self.console.print(t)
+                            frame.append(clear)
 
-                    self.console.print()
+                        if RICH_AVAILABLE:
+                            if not show_ascii:
+                                with self.console.capture() as capture:
+                                    self.console.print(Text(title, style="bold white"))
+                                frame.append(capture.get())
+                        else:
+                            frame.append(f"{title}\n\n")
 
-                    if show_instructions:
-                        self.console.print(Text("Use ↑/↓ arrow keys to navigate, Enter to select", style="dim"))
+                        for i, lines in enumerate(option_lines):
+                            frame.append(lines[i == selected])
+                        frame.append("\n")
 
-                    key = self.get_key()
-                else:
-                    print(f"{title}\n")
-                    for i, option in enumerate(options):
-                        if i == selected:
-                            print(f"▶ {option}")
-                        else:
-                            print(f"  {option}")
-                    print()
-                    if show_instructions:
-                        print("Use ↑/↓ arrow keys to navigate, Enter to select")
-                    key = self.get_key()
-
-                instruction_lines = 1 if show_instructions else 0
-                prev_printed_lines = 1 + len(options) + 1 + instruction_lines
-
-                if key == '\x1b[A':
-                    selected = max(0, selected - 1)
-                elif key == '\x1b[B':
-                    selected = min(max_index, selected + 1)
-                elif key == '\r' or key == '\n':
-                    return selected
-                elif key == '\x03':
-                    raise KeyboardInterrupt
+                        if show_instructions:
+                            if RICH_AVAILABLE:
+                                with self.console.capture() as capture:
+                                    self.console.print(Text("Use ↑/↓ arrow keys to navigate, Enter to select", style="dim"))
+                                frame.append(capture.get())
+                            else:
+                                frame.append("Use ↑/↓ arrow keys to navigate, Enter to select\n")
+                    elif selected != last_selected:
+                        # Only the old and new selection change: jump up to each row, rewrite it, come back
+                        for i in (last_selected, selected):
+                            up = len(options) - i + trailing_lines
+                            line = option_lines[i][i == selected].rstrip("\n")
+                            frame.append(f"\033[{up}F\033[2K{line}\033[{up}E")
+
+                    if banner is not None:
+                        sys.stdout.flush()
+                        sys.stdout.buffer.write(banner + "".join(frame).encode("utf-8"))
+                        sys.stdout.buffer.flush()
+                    elif frame:
+                        sys.stdout.write("".join(frame))
+                        sys.stdout.flush()
+                    last_selected = selected
+                    action = _KEY_MAP.get(self._read_key_raw(fd))
+
+                    if action == 'UP':
+                        selected = max(0, selected - 1)
+                    elif action == 'DOWN':
+                        selected = min(max_index, selected + 1)
+                    elif action == 'ENTER':
+                        return selected
+                    elif action == 'INTERRUPT':
+                        raise KeyboardInterrupt
         finally:
             print("\033[?25h", end="")
             sys.stdout.flush()
@@ -1,24 +1,73 @@
 #!/usr/bin/env python3
 
+import functools
 import os
+import sys
 
 try:
     from rich.console import Console
     from rich.panel import Panel
-    from rich.prompt import Prompt
-    from rich.align import Align
-    from rich import box
+    from rich.text import Text
+    from rich.table import Table
+    from rich.padding import Padding
     RICH_AVAILABLE = True
 except ImportError:
     RICH_AVAILABLE = False
 
+@functools.lru_cache(maxsize=8)
+def _modal_content(title_text, hint_text):
+    # One styled Text is all a left-aligned title and hint need; built once per prompt
+    return Text.assemble("\n", (title_text, "bold white"), "\n", (hint_text, "dim white"))
+
+@functools.lru_cache(maxsize=1)
+def _enable_vt():
+    # An empty system() call switches Windows 10+ consoles to VT processing for the process lifetime
+    if os.name == 'nt':
+        os.system('')
+
+_MODAL_WIDTH = 64
+
+@functools.lru_cache(maxsize=8)
+def _centered(text):
+    return text.center(_MODAL_WIDTH)
+
+# (label, info key) rows for the info modals
+_VIDEO_FIELDS = (
+    ("Title:", "title"),
+    ("Duration:", "duration"),
+    ("Uploader:", "uploader"),
+    ("Views:", "view_count"),
+    ("Platform:", "platform"),
+)
+_PLAYLIST_FIELDS = (
+    ("Title:", "title"),
+    ("Videos:", "video_count"),
+    ("Uploader:", "uploader"),
+    ("Platform:", "platform"),
+)
+
+_CYAN_PANEL_KW = dict(border_style="cyan", width=60)
+_RED_PANEL_KW = dict(border_style="red", width=60)
+
 class Modal:
     def __init__(self):
-        if RICH_AVAILABLE:
-            self.console = Console()
+        self._console = None
+    
+    @property
+    def console(self):
+        # Built on first use so constructing Modal doesn't probe the terminal
+        if self._console is None:
+            self._console = Console()
+        return self._console
     
     def clear_screen(self):
-        os.system('clear' if os.name == 'posix' else 'cls')
+        # Home + clear via ANSI instead of spawning a shell; the shell is only used off-TTY
+        if sys.stdout.isatty():
+            _enable_vt()
+            sys.stdout.write("\033[H\033[2J")
+            sys.stdout.flush()
+        else:
+            os.system('clear' if os.name == 'posix' else 'cls')
     
     def show_url_input_modal(self):
         if RICH_AVAILABLE:
@@ -33,111 +82,58 @@ class Modal:
             return self._show_simple_modal("Enter Playlist URL Below", "Paste your playlist URL and press Enter")
     
     def _show_rich_modal(self, title_text="Enter URL Below", hint_text="Paste your video URL and press Enter"):
-        from rich.panel import Panel
-        from rich.text import Text
-        from rich.align import Align
-        from rich import box
-        from rich.console import Group
         self.console.print("\n\n")
-        title = Text(title_text, style="bold white")
-        hint = Text(hint_text, style="dim white")
-        modal_content = Group(
-            Align.left(Text("\n"), vertical="top"),
-            Align.left(title, vertical="top"),
-            Align.left(hint, vertical="top"),
-        )
-        self.console.print(modal_content)
+        self.console.print(_modal_content(title_text, hint_text))
         url = self.console.input("[bold bright_blue]> [/bold bright_blue]")
         return url.strip() if url else None
     
     def _show_simple_modal(self, title_text="Enter URL Below", hint_text="Paste your video URL and press Enter"):
         print("\n\n")
-        width = 64
-        print(title_text.center(width))
-        print(hint_text.center(width))
+        print(_centered(title_text))
+        print(_centered(hint_text))
         url = input("> ").strip()
         return url if url else None
 
-    def show_video_info_modal(self, info: dict | None):
-        if RICH_AVAILABLE:
-            from rich.panel import Panel
-            from rich.table import Table
-            from rich.padding import Padding
-
-            table = Table.grid(padding=(0, 1))
-            table.add_column(justify="right", style="bold cyan", no_wrap=True)
-            table.add_column(justify="left")
+    def _make_info_grid(self):
+        table = Table.grid(padding=(0, 1))
+        table.add_column(justify="right", style="bold cyan", no_wrap=True)
+        table.add_column(justify="left")
+        return table
 
-            if info and 'error' not in info:
-                table.add_row("Title:", info.get('title', 'Unknown'))
-                table.add_row("Duration:", info.get('duration', 'Unknown'))
-                table.add_row("Uploader:", info.get('uploader', 'Unknown'))
-                table.add_row("Views:", str(info.get('view_count', 'Unknown')))
-                table.add_row("Platform:", info.get('platform', 'Unknown'))
-                panel = Panel(Padding(table, (0, 1)), title="Video Info", border_style="cyan", width=60)
-            else:
-                error_msg = "Could not retrieve video information"
-                if info and 'message' in info:
-                    error_msg = info['message']
-                table.add_row("Error:", error_msg)
-                panel = Panel(Padding(table, (0, 1)), title="Error", border_style="red", width=60)
+    def _render_info(self, fields, title, panel_kw):
+        table = self._make_info_grid()
+        for label, value in fields:
+            table.add_row(label, value)
+        self.console.print("\n")
+        self.console.print(Panel(Padding(table, (0, 1)), title=title, **panel_kw), justify="left")
+        self.console.print("\n")
 
-            self.console.print("\n")
-            self.console.print(panel, justify="left")
-            self.console.print("\n")
+    def _show_info(self, info, fields, title, heading, default_error):
+        if info and 'error' not in info:
+            rows = [(label, str(info.get(key, 'Unknown'))) for label, key in fields]
+            error_msg = None
         else:
-            print()
-            if info and 'error' not in info:
-                print("\nVideo Information:")
-                print(f"   Title: {info.get('title', 'Unknown')}")
-                print(f"   Duration: {info.get('duration', 'Unknown')}")
-                print(f"   Uploader: {info.get('uploader', 'Unknown')}")
-                print(f"   Views: {info.get('view_count', 'Unknown')}")
-                print(f"   Platform: {info.get('platform', 'Unknown')}")
-            else:
-                error_msg = "Could not retrieve video information"
-                if info and 'message' in info:
-                    error_msg = info['message']
-                print(f"\nError: {error_msg}")
-            print()
+            rows = None
+            error_msg = default_error
+            if info and 'message' in info:
+                error_msg = info['message']
 
-    def show_playlist_info_modal(self, info: dict | None):
         if RICH_AVAILABLE:
-            from rich.panel import Panel
-            from rich.table import Table
-            from rich.padding import Padding
-
-            table = Table.grid(padding=(0, 1))
-            table.add_column(justify="right", style="bold cyan", no_wrap=True)
-            table.add_column(justify="left")
-
-            if info and 'error' not in info:
-                table.add_row("Title:", info.get('title', 'Unknown'))
-                table.add_row("Videos:", str(info.get('video_count', 'Unknown')))
-                table.add_row("Uploader:", info.get('uploader', 'Unknown'))
-                table.add_row("Platform:", info.get('platform', 'Unknown'))
-                panel = Panel(Padding(table, (0, 1)), title="Playlist Info", border_style="cyan", width=60)
+            if rows is not None:
+                self._render_info(rows, title, _CYAN_PANEL_KW)
             else:
-                error_msg = "Could not retrieve playlist information"
-                if info and 'message' in info:
-                    error_msg = info['message']
-                table.add_row("Error:", error_msg)
-                panel = Panel(Padding(table, (0, 1)), title="Error", border_style="red", width=60)
-
-            self.console.print("\n")
-            self.console.print(panel, justify="left")
-            self.console.print("\n")
+                self._render_info([("Error:", error_msg)], "Error", _RED_PANEL_KW)
         else:
-            print()
-            if info and 'error' not in info:
-                print("\nPlaylist Information:")
-                print(f"   Title: {info.get('title', 'Unknown')}")
-                print(f"   Videos: {info.get('video_count', 'Unknown')}")
-                print(f"   Uploader: {info.get('uploader', 'Unknown')}")
-                print(f"   Platform: {info.get('platform', 'Unknown')}")
+            if rows is not None:
+                lines = [f"\n{heading}", *(f"   {label} {value}" for label, value in rows)]
             else:
-                error_msg = "Could not retrieve playlist information"
-                if info and 'message' in info:
-                    error_msg = info['message']
-                print(f"\nError: {error_msg}")
-            print()
+                lines = [f"\nError: {error_msg}"]
+            sys.stdout.write("\n" + "\n".join(lines) + "\n\n")
+
+    def show_video_info_modal(self, info: dict | None):
+        self._show_info(info, _VIDEO_FIELDS, "Video Info", "Video Information:",
+                        "Could not retrieve video information")
+
+    def show_playlist_info_modal(self, info: dict | None):
+        self._show_info(info, _PLAYLIST_FIELDS, "Playlist Info", "Playlist Information:",
+                        "Could not retrieve playlist information")
@@ -1,16 +1,39 @@
 #!/usr/bin/env python3
 
+import itertools
+import os
 import sys
 import time
 import threading
 
+def _write(text):
+    # Each frame goes out as one write; sys.stdout is looked up per call so redirection is respected
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+def _progress_interval():
+    # Minimum seconds between redraws; VELORA_PROGRESS_INTERVAL overrides the default
+    try:
+        return float(os.environ.get("VELORA_PROGRESS_INTERVAL", 0.05))
+    except ValueError:
+        return 0.05
+
+# Red, yellow, green, cyan for each quarter of progress
+_PROGRESS_COLORS = ("\033[31m", "\033[33m", "\033[32m", "\033[36m")
+
 class ProgressBar:
     def __init__(self, width=50, style="▰▱"):
         self.width = width
         self.style = style
+        self._full = style[0] * width
+        self._empty_char = style[1]
         self.current = 0
         self.total = 100
         self.message = ""
+        self._min_interval = _progress_interval()
+        self._last_draw = 0.0
+        # Redirected output gets no frames, only a summary line from finish()
+        self._isatty = sys.stdout.isatty()
 
     def update(self, current=None, total=None, message=""):
         if current is not None:
@@ -20,6 +43,14 @@ class ProgressBar:
         if message:
             self.message = message
 
+        if not self._isatty:
+            return
+
+        # Skip frames that arrive faster than the terminal needs them, but always draw the last one
+        now = time.monotonic()
+        if now - self._last_draw < self._min_interval and self.current < self.total:
+            return
+        self._last_draw = now
         self._draw()
 
     def _draw(self):
@@ -28,34 +59,31 @@ class ProgressBar:
         else:
             percentage = min(100, (self.current / self.total) * 100)
 
+        _write(self._frame(percentage, self.message))
+
+    def _frame(self, percentage, message):
         filled = int(self.width * percentage / 100)
-        bar = self.style[0] * filled + self.style[1] * (self.width - filled)
-
-        if percentage < 25:
-            color = "\033[31m"
-        elif percentage < 50:
-            color = "\033[33m"
-        elif percentage < 75:
-            color = "\033[32m"
-        else:
-            color = "\033[36m"
+        bar = self._full[:filled].ljust(self.width, self._empty_char)
+        color = _PROGRESS_COLORS[max(0, min(int(percentage // 25), 3))]
 
         reset = "\033[0m"
 
-        sys.stdout.write('\r')
-        sys.stdout.write(f"  {color}[{bar}]{reset} {percentage:5.1f}% {self.message}")
-        sys.stdout.flush()
+        return f"\r  {color}[{bar}]{reset} {percentage:5.1f}% {message}"
 
     def finish(self, message="Complete"):
         self.update(100, 100, message)
-        sys.stdout.write('\n')
-        sys.stdout.flush()
+        if self._isatty:
+            _write('\n')
+        else:
+            _write(f"[Complete] {message}\n")
 
     def simulate_progress(self, duration=5, steps=20):
         step_time = duration / steps
-        for i in range(steps + 1):
-            progress = (i / steps) * 100
-            self.update(progress, 100, f"Processing... {i}/{steps}")
+        # The frames are fully known up front, so format them all before the timed loop
+        frames = [self._frame((i / steps) * 100, f"Processing... {i}/{steps}") for i in range(steps + 1)]
+        for frame in frames:
+            if self._isatty:
+                _write(frame)
             time.sleep(step_time)
         self.finish("Done!")
 
@@ -63,27 +91,47 @@ class Spinner:
     def __init__(self, message="Loading..."):
         self.message = message
         self.spinner_chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-        self.running = False
+        self._stop = threading.Event()
         self.thread = None
+        self._cycle = itertools.cycle(self.spinner_chars)
+        self._last = 0.0
+        self._isatty = sys.stdout.isatty()
+
+    def tick(self):
+        # Called from the caller's own wait loop; advances at most once per 100 ms
+        if not self._isatty:
+            return
+        now = time.monotonic()
+        if now - self._last < 0.1:
+            return
+        self._last = now
+        self._draw()
+
+    def clear(self):
+        if not self._isatty:
+            return
+        _write('\r' + ' ' * (len(self.message) + 2) + '\r')
 
     def start(self):
-        self.running = True
+        # Only for callers blocked in a single call with no loop to tick() from
+        if not self._isatty:
+            return
+        self._stop.clear()
         self.thread = threading.Thread(target=self._spin)
         self.thread.daemon = True
         self.thread.start()
 
     def stop(self):
-        self.running = False
+        # Wakes _spin out of its wait immediately instead of after the next 100 ms sleep
+        self._stop.set()
         if self.thread:
             self.thread.join()
-        sys.stdout.write('\r' + ' ' * (len(self.message) + 2) + '\r')
-        sys.stdout.flush()
+        self.clear()
+
+    def _draw(self):
+        _write(f'\r{next(self._cycle)} {self.message}')
 
     def _spin(self):
-        i = 0
-        while self.running:
-            char = self.spinner_chars[i % len(self.spinner_chars)]
-            sys.stdout.write(f'\r{char} {self.message}')
-            sys.stdout.flush()
-            time.sleep(0.1)
-            i += 1
+        while not self._stop.is_set():
+            self._draw()
+            self._stop.wait(0.1)
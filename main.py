@@ -4,8 +4,11 @@
 import sys
 import os
 
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
+# Frozen builds already have the bundle on sys.path; __file__ is absolute for scripts on 3.9+
+if not getattr(sys, 'frozen', False):
+    current_dir = os.path.dirname(__file__)
+    if current_dir and current_dir not in sys.path:
+        sys.path.insert(0, current_dir)
 
 from Velora.app import VeloraApp
 
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import unittest
+
+from Velora.ffmpeg_utils import _ENCODER_CODEC_NAMES, _codec_name
+
+
+class CodecNameTest(unittest.TestCase):
+    def test_mapped_names_are_codecs(self):
+        # Values are compared against ffprobe's codec_name, which never carries a library prefix
+        for encoder, codec in _ENCODER_CODEC_NAMES.items():
+            with self.subTest(encoder=encoder):
+                self.assertEqual(_codec_name(encoder), codec)
+                self.assertFalse(codec.startswith('lib'))
+                self.assertNotIn('_', codec)
+
+    def test_library_encoders(self):
+        expected = {
+            'libx264': 'h264',
+            'libx265': 'hevc',
+            'libvpx': 'vp8',
+            'libvpx-vp9': 'vp9',
+            'libfdk_aac': 'aac',
+            'libmp3lame': 'mp3',
+            'libopus': 'opus',
+        }
+        for encoder, codec in expected.items():
+            with self.subTest(encoder=encoder):
+                self.assertEqual(_codec_name(encoder), codec)
+
+    def test_hardware_and_native_encoders(self):
+        self.assertEqual(_codec_name('h264_nvenc'), 'h264')
+        self.assertEqual(_codec_name('hevc_videotoolbox'), 'hevc')
+        self.assertEqual(_codec_name('h264_qsv'), 'h264')
+        self.assertEqual(_codec_name('aac'), 'aac')
+
+
+if __name__ == '__main__':
+    unittest.main()